@@ -1,210 +1,60 @@
-import pandas as pd
-from bs4 import BeautifulSoup
-from datetime import datetime
-from playwright.sync_api import sync_playwright
+import asyncio
 import os
-from glob import glob
-
-# Install fuzzywuzzy jika belum ada
-try:
-    from fuzzywuzzy import fuzz
-except ImportError:
-    print("Installing fuzzywuzzy...")
-    os.system("pip install fuzzywuzzy python-Levenshtein")
-    from fuzzywuzzy import fuzz
-
-# Daftar aturan untuk menangani singkatan klub
-CLUB_ALIASES = {
-  "adelaide united": ["adelaide", "the reds"],
-  "auckland fc": ["auckland", "the blues"],
-  "brisbane roar": ["brisbane", "the roar"],
-  "central coast mariners": ["mariners", "central coast", "the yellow and navy"],
-  "macarthur fc": ["macarthur", "the bulls"],
-  "melbourne city fc": ["melbourne city", "city", "the heart"],
-  "melbourne victory": ["melbourne vic", "victory", "the big v"],
-  "newcastle united jets": ["newcastle jets", "jets", "the jets"],
-  "perth glory": ["perth", "glory", "the glory"],
-  "sydney fc": ["sydney", "the sky blues"],
-  "wellington phoenix": ["wellington", "phoenix", "the nix"],
-  "western sydney wanderers": ["wanderers", "western sydney", "the red and black"],
-  "western united fc": ["western united", "united", "the green and black"]
-}
-
-def normalize_club_name(club_name):
-    return club_name.lower().strip()
-
-def get_canonical_club_name(club_name):
-    club_name_normalized = normalize_club_name(club_name)
-    for canonical_name, aliases in CLUB_ALIASES.items():
-        if club_name_normalized in [normalize_club_name(alias) for alias in aliases]:
-            return canonical_name
-    return club_name_normalized
-
-def is_club_match(club1, club2, threshold=80):
-    club1_canonical = get_canonical_club_name(club1)
-    club2_canonical = get_canonical_club_name(club2)
-    if club1_canonical == club2_canonical:
-        return True
-    club1_normalized = normalize_club_name(club1)
-    club2_normalized = normalize_club_name(club2)
-    similarity = fuzz.ratio(club1_normalized, club2_normalized)
-    return similarity >= threshold
-
-def convert_to_transfers_url(profile_url):
-    return profile_url.replace('/profil/', '/transfers/')
-
-def get_transfer_history(profile_url):
-    transfers_url = convert_to_transfers_url(profile_url)
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        page.set_extra_http_headers({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-        print(f"Fetching URL with Playwright: {transfers_url}")
-        try:
-            page.goto(transfers_url)
-            page.wait_for_selector('div.tm-player-transfer-history-grid', timeout=15000)
-            html_content = page.content()
-            soup = BeautifulSoup(html_content, 'html.parser')
-            transfer_rows = soup.find_all('div', class_='grid tm-player-transfer-history-grid')
-            if not transfer_rows:
-                return []
-            transfers = []
-            for row in transfer_rows:
-                if 'tm-player-transfer-history-grid--sum' in row.get('class', []) or 'tm-player-transfer-history-grid--heading' in row.get('class', []):
-                    continue
-                season = row.find('div', class_='tm-player-transfer-history-grid__season')
-                date = row.find('div', class_='tm-player-transfer-history-grid__date')
-                old_club = row.find('div', class_='tm-player-transfer-history-grid__old-club')
-                new_club = row.find('div', class_='tm-player-transfer-history-grid__new-club')
-                if season and date and old_club and new_club:
-                    season_text = season.text.strip()
-                    date_text = date.text.strip()
-                    old_club_text = old_club.find('a', class_='tm-player-transfer-history-grid__club-link')
-                    old_club_text = old_club_text.text.strip() if old_club_text else old_club.text.strip()
-                    new_club_text = new_club.find('a', class_='tm-player-transfer-history-grid__club-link')
-                    new_club_text = new_club_text.text.strip() if new_club_text else new_club.text.strip()
-                    transfer = {
-                        'season': season_text,
-                        'date': date_text,
-                        'old_club': old_club_text,
-                        'new_club': new_club_text
-                    }
-                    transfers.append(transfer)
-            transfers.sort(key=lambda x: parse_date(x['date']) if parse_date(x['date']) else datetime.min)
-            return transfers
-        except Exception as e:
-            print(f"Error fetching {transfers_url}: {e}")
-            return []
-        finally:
-            browser.close()
-
-def parse_date(date_str):
-    try:
-        return datetime.strptime(date_str, '%b %d, %Y')
-    except ValueError:
-        try:
-            return datetime.strptime(date_str, '%d %b %Y')
-        except ValueError:
-            return None
-
-def get_period_in_club(transfers, target_club):
-    periods = []
-    current_start = None
-    target_club_normalized = normalize_club_name(target_club)
-    for transfer in transfers:
-        date = parse_date(transfer['date'])
-        if date is None:
-            continue
-        old_club = transfer['old_club']
-        new_club = transfer['new_club']
-        if is_club_match(new_club, target_club):
-            if not current_start:
-                current_start = date
-        elif is_club_match(old_club, target_club) and current_start:
-            periods.append((current_start, date))
-            current_start = None
-    if current_start:
-        for transfer in transfers:
-            if transfer['new_club'].lower() == 'retired':
-                end_date = parse_date(transfer['date'])
-                if end_date:
-                    periods.append((current_start, end_date))
-                    current_start = None
-                    break
-        if current_start:
-            periods.append((current_start, datetime.now()))
-    return periods
-
-# Ambil semua file CSV di folder raw
-dataset_folder = 'raw'
-csv_files = glob(os.path.join(dataset_folder, '*.csv'))
-
-if not csv_files:
-    print("No CSV files found in 'raw' folder.")
-    exit()
-
-# Buat folder 'period' jika belum ada
-output_base_folder = 'period'
-os.makedirs(output_base_folder, exist_ok=True)
-
-# Proses setiap file CSV
-all_results = []
-for csv_file in csv_files:
-    print(f"\nProcessing file: {csv_file}")
-    try:
-        df = pd.read_csv(csv_file, encoding='utf-8')
-    except UnicodeDecodeError:
-        print("UTF-8 failed, trying latin-1 encoding...")
-        df = pd.read_csv(csv_file, encoding='latin-1')
-
-    print("Columns:", df.columns.tolist())
-    print("Data:", df.to_dict(orient='records'))
-
-    for index, row in df.iterrows():
-        name = row['name']
-        club = row['club']
-        profile_url = row['profile_url']
-        
-        print(f"\nProcessing {name} for club {club}...")
-        transfers = get_transfer_history(profile_url)
-        if not transfers:
-            print(f"No transfer history found for {name}")
-            continue
-        
-        periods_list = get_period_in_club(transfers, club)
-        if not periods_list:
-            print(f"No periods found for {name} in {club}")
-            periods_combined = "NO DATA"
-        else:
-            period_strings = [f"{start.strftime('%Y')}-{end.strftime('%Y')}" for start, end in periods_list]
-            periods_combined = ", ".join(period_strings)
-        
-        period_strings = [f"{start.strftime('%Y')}-{end.strftime('%Y')}" for start, end in periods_list]
-        periods_combined = ", ".join(period_strings)
-        
-        all_results.append({
-            'name': name,
-            'club': club,
-            'periods': periods_combined
-        })
-
-# Buat DataFrame dari semua hasil
-results_df = pd.DataFrame(all_results)
-
-if results_df.empty:
-    print("No results to process.")
-    exit()
-
-print("\nAll Results:")
-print(results_df)
-
-# Simpan hasil per klub dalam satu file CSV
-for club in results_df['club'].unique():
-    club_df = results_df[results_df['club'] == club]
-    club_filename = normalize_club_name(club).replace(" ", "_") + ".csv"
-    output_file = os.path.join(output_base_folder, club_filename)
-    
-    club_df.to_csv(output_file, index=False)
-    print(f"Saved {len(club_df)} records for {club} to {output_file}")
\ No newline at end of file
+import sys
+
+# Modul bersama ada di root repo. Script ini menjalankan LeagueJob yang sama dengan _run_all_periods.py,
+# hanya untuk liga ini dan dengan browser sendiri, sehingga kedua jalur selalu memberi hasil yang sama
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from period_engine.browser_pool import AsyncPagePool
+from period_engine.context_profile import LightweightProfile
+from period_engine.leagues import LeagueJob
+from period_engine.player_registry import PlayerRegistry
+from period_engine.timing import timer
+
+LEAGUE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Jumlah halaman yang diproses bersamaan (bisa diatur lewat environment variable)
+CONCURRENCY = int(os.environ.get('PERIOD_CONCURRENCY', '4'))
+
+# Cara mengambil riwayat transfer: api (JSON langsung), capture (dengar respons JSON saat halaman dimuat)
+# atau dom (tunggu grid dirender). api/capture otomatis kembali ke dom jika gagal.
+FETCH_MODE = os.environ.get('PERIOD_FETCH_MODE', 'api')
+
+# Profil ringan: blokir gambar, font, CSS, iklan & analytics (PERIOD_BLOCK_RESOURCES=0 untuk mematikan)
+context_profile = LightweightProfile() if os.environ.get('PERIOD_BLOCK_RESOURCES', '1') == '1' else None
+
+# Cache riwayat transfer per ID pemain (TTL dalam hari; PERIOD_FORCE_REFRESH=1 untuk mengabaikan cache).
+# Cache ada di root repo (cache/transfers) dan dipakai semua liga lewat registri pemain lintas liga,
+# sehingga pemain yang muncul di beberapa liga cukup diambil sekali; cache lama liga ini ikut disalin ke sana
+CACHE_TTL_DAYS = float(os.environ.get('PERIOD_CACHE_TTL_DAYS', '30'))
+FORCE_REFRESH = os.environ.get('PERIOD_FORCE_REFRESH') == '1'
+player_registry = PlayerRegistry.shared(ttl_days=CACHE_TTL_DAYS, force_refresh=FORCE_REFRESH)
+
+# Jurnal hasil per pemain di cache/, ditulis langsung ke disk; PERIOD_RESUME=1 melanjutkan run yang terhenti
+RESUME = os.environ.get('PERIOD_RESUME') == '1'
+
+# Waktu per fase (launch, goto, wait_for_selector, parse, match, ...) diringkas di akhir;
+# PERIOD_TIMING_JSONL=<file> menyimpan waktu mentah per pemain dalam format JSONL
+if os.environ.get('PERIOD_TIMING_JSONL'):
+    timer.dump_to(os.environ['PERIOD_TIMING_JSONL'])
+
+# Pemain dari raw/ (ditambah top_assists dari input/) diproses secara paralel; hasil langsung ditulis ke
+# period/<klub>.csv.part dan diganti jadi period/<klub>.csv saat klub selesai, sehingga _order_period.py
+# bisa mulai memproses klub yang sudah selesai. Pemain tanpa periode ditulis dengan kolom periods kosong.
+job = LeagueJob(LEAGUE_DIR, 'get', fetch_mode=FETCH_MODE, cache_ttl_days=CACHE_TTL_DAYS,
+                force_refresh=FORCE_REFRESH, resume=RESUME, player_registry=player_registry,
+                career_index_path=os.environ.get('PERIOD_CAREER_INDEX'))
+
+
+async def run():
+    async with AsyncPagePool(size=CONCURRENCY, profile=context_profile) as page_pool:
+        return await job.run(page_pool)
+
+
+print(asyncio.run(run()))
+player_registry.save()
+print(player_registry.summary())
+if context_profile is not None:
+    print(context_profile.summary())
+print(timer.summary())
+timer.close()
@@ -1,30 +1,21 @@
-import pandas as pd
-from pathlib import Path
+import os
+import sys
 
-# Path folder
-period_folder = Path("period")
-raw_folder = Path("raw")
+# Modul bersama ada di root repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from period_engine.merge import merge_periods
 
-# Dapatkan semua file di folder period
-for period_file in period_folder.glob("*.csv"):
-    club_name = period_file.stem  # Nama klub tanpa ekstensi
-    raw_file = raw_folder / f"{club_name}_top_goals.csv"  # Sesuaikan dengan pola nama di raw
-    
-    if raw_file.exists():
-        # Baca data dari folder period
-        period_df = pd.read_csv(period_file)
-        
-        # Baca data dari folder raw
-        raw_df = pd.read_csv(raw_file)
-        
-        # Gabungkan berdasarkan kolom 'name'
-        merged_df = raw_df.merge(period_df[['name', 'periods']], on='name', how='left')
-        
-        # Update kolom 'period' dengan data dari 'periods'
-        merged_df['period'] = merged_df['periods']
-        
-        # Hapus kolom tambahan
-        merged_df = merged_df.drop(columns=['periods'])
-        
-        # Simpan kembali ke folder raw
-        merged_df.to_csv(raw_file, index=False)
+# Semua file period/*.csv dibaca sekali lalu digabung ke semua leaderboard (raw/ dan input/) sekaligus,
+# dicocokkan berdasarkan ID pemain + klub (bukan nama). Hanya file yang isinya berubah yang ditulis ulang.
+# PERIOD_PATCH_JSON=1 juga memperbarui kolom period di output/*.json
+PATCH_JSON = os.environ.get('PERIOD_PATCH_JSON') == '1'
+
+counts = merge_periods('period', ['raw', 'input'], json_folder='output' if PATCH_JSON else None)
+if not counts['periods']:
+    print("No period files found in 'period' folder.")
+    exit()
+
+print(f"{counts['periods']} periods matched to {counts['rows']} rows of {counts['files']} leaderboards; "
+      f"{counts['rewritten']} files rewritten")
+if PATCH_JSON:
+    print(f"{counts['json_rewritten']} JSON outputs rewritten")
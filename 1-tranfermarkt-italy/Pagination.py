@@ -2,15 +2,49 @@ import asyncio
 import csv
 import os
 import logging
+from datetime import date
 from urllib.parse import urljoin
-from playwright.async_api import async_playwright, Page
-from typing import List, Dict
+from playwright.async_api import async_playwright, BrowserContext, Page
+from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
+import pandas as pd
 import pycountry
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Jumlah halaman profil yang dibuka bersamaan saat melengkapi data pemain (bisa diatur lewat environment variable)
+PROFILE_CONCURRENCY = int(os.environ.get('PROFILE_CONCURRENCY', '4'))
+
+# Jumlah klub dari urls.txt yang di-scrape bersamaan dalam satu browser
+CLUB_CONCURRENCY = int(os.environ.get('CLUB_CONCURRENCY', '3'))
+
+# Data profil untuk pemain tanpa URL profil atau yang profilnya gagal diambil
+UNKNOWN_PROFILE = {"jersey_name": "Unknown", "full_name": "Unknown", "place_of_birth": "Unknown", "position": "Unknown", "height": "Unknown", "jersey_number": "Unknown",
+                   "foot": "Unknown", "player_agent": "Unknown", "contract_expires": "Unknown", "citizenship": "Unknown"}
+
+# Label di info-table halaman profil -> kolom dataset; semua label terbaca dalam satu kali jalan, jadi kolom tambahan tidak menambah biaya
+INFO_TABLE_FIELDS = {
+    "Name in home country:": "full_name",
+    "Place of birth:": "place_of_birth",
+    "Position:": "position",
+    "Height:": "height",
+    "Foot:": "foot",
+    "Player agent:": "player_agent",
+    "Contract expires:": "contract_expires",
+    "Citizenship:": "citizenship",
+}
+
+# Profil hanya diambil untuk pemain yang bisa masuk top-N leaderboard (_dataset_to_input.py menyimpan top 100 gol & assist);
+# profil yang sudah ada di dataset dipakai ulang. 0 = ambil ulang profil semua pemain seperti dulu
+PROFILE_TOP_N = int(os.environ.get('PROFILE_TOP_N', '100'))
+
+# Profil tersimpan diambil ulang jika kolomnya belum lengkap (dataset lama) atau sudah lebih tua dari sekian hari,
+# supaya klub, agen dan kontrak yang berubah ikut diperbarui. 0 = tanpa batas umur
+PROFILE_MAX_AGE_DAYS = float(os.environ.get('PROFILE_MAX_AGE_DAYS', '180'))
+LEADERBOARD_COLUMNS = ["goals", "assists"]
+
 def get_country_code(country_name: str) -> str:
     """Convert country name to country code."""
     try:
@@ -18,6 +52,38 @@ def get_country_code(country_name: str) -> str:
     except LookupError:
         return "unknown"
 
+def stat_value(value: str) -> int:
+    """Numeric value of a table statistic ('-' and blanks count as 0)."""
+    try:
+        return int(value.replace('.', '').replace(',', ''))
+    except (ValueError, AttributeError):
+        return 0
+
+def leaderboard_candidates(players: List[Dict[str, str]], top_n: int = PROFILE_TOP_N) -> List[int]:
+    """Indexes of the players that make any leaderboard, picked with the same sort as _dataset_to_input.py."""
+    if top_n <= 0:
+        return list(range(len(players)))
+    stats = pd.DataFrame({column: [stat_value(player.get(column, "")) for player in players] for column in LEADERBOARD_COLUMNS})
+    selected = set()
+    for column in LEADERBOARD_COLUMNS:
+        selected.update(stats.sort_values(by=column, ascending=False).head(top_n).index)
+    return sorted(selected)
+
+def has_profile(player: Dict[str, str]) -> bool:
+    return any(player.get(field, "Unknown") != "Unknown" for field in UNKNOWN_PROFILE)
+
+def profile_is_fresh(player: Dict[str, str], max_age_days: float = PROFILE_MAX_AGE_DAYS) -> bool:
+    """Whether a stored row has every UNKNOWN_PROFILE column and was scraped less than `max_age_days` ago."""
+    if not has_profile(player) or any(field not in player for field in UNKNOWN_PROFILE):
+        return False
+    if max_age_days <= 0:
+        return True
+    try:
+        scraped = date.fromisoformat(player.get("profile_scraped") or "")
+    except ValueError:
+        return False
+    return (date.today() - scraped).days < max_age_days
+
 def extract_table_data(html: str, base_url: str) -> List[Dict[str, str]]:
     """Extract player data from HTML content."""
     soup = BeautifulSoup(html, 'html.parser')
@@ -79,11 +145,64 @@ def extract_table_data(html: str, base_url: str) -> List[Dict[str, str]]:
     
     return players_list
 
+class ProfileFilter(ElementFilter):
+    """Build only the parts of a profile page parse_profile() reads: the heading, the info-table and the national-career rows."""
+    CLASSES = {"info-table", "national-career__row"}
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name == "h1":
+            return True
+        classes = (attrs or {}).get("class", "")
+        if not isinstance(classes, str):
+            classes = " ".join(classes)
+        return name == "div" and not self.CLASSES.isdisjoint(classes.split())
+    
+    def allow_string_creation(self, string) -> bool:
+        # Teks di dalam elemen yang disimpan tetap dibuat; teks di luarnya tidak dibutuhkan
+        return False
+
+def parse_info_table(soup: BeautifulSoup) -> Dict[str, str]:
+    """Every label -> value pair of the profile's info-table, read in one walk over its spans."""
+    info = {}
+    table = soup.find('div', class_='info-table')
+    if table is None:
+        return info
+    
+    label = None
+    for span in table.find_all('span', class_='info-table__content'):
+        classes = span.get('class', [])
+        if 'info-table__content--regular' in classes:
+            label = span.get_text(strip=True)
+        elif 'info-table__content--bold' in classes and label is not None:
+            if label == "Citizenship:":
+                # Tiap kewarganegaraan punya bendera dengan nama negara di alt
+                info[label] = ", ".join(img['alt'] for img in span.find_all('img', alt=True)) or span.get_text(strip=True)
+            else:
+                info[label] = span.get_text(strip=True)
+            label = None
+    return info
+
+def parse_profile(html: str) -> Dict[str, str]:
+    """Profile fields of a player page: the heading, the national-career shirt number and the info-table."""
+    soup = BeautifulSoup(html, 'html.parser', parse_only=ProfileFilter())
+    
+    heading_element = soup.find('h1')
+    jersey_name = heading_element.find('strong').get_text(strip=True) if heading_element and heading_element.find('strong') else "Unknown"
+    
+    numjersey_element = soup.find('div', class_='national-career__row')
+    numjersey = numjersey_element.find_next('div', class_='national-career__cell--red').get_text(strip=True) if numjersey_element else "Unknown"
+    
+    info = parse_info_table(soup)
+    profile_data = {"jersey_name": jersey_name, "jersey_number": numjersey}
+    for label, field in INFO_TABLE_FIELDS.items():
+        profile_data[field] = info.get(label, "Unknown")
+    return profile_data
+
 async def scrape_profile_data(page: Page, profile_url: str) -> Dict[str, str]:
     """Scrape additional data from player's profile page with detailed logging."""
     if profile_url == "Unknown":
         logging.info(f"Skipping profile scraping: Profile URL is 'Unknown'")
-        return {"jersey_name": "Unknown", "full_name": "Unknown", "place_of_birth": "Unknown", "position": "Unknown", "height": "Unknown", "jersey_number": "Unknown"}
+        return dict(UNKNOWN_PROFILE)
     
     logging.info(f"Starting profile scrape for URL: {profile_url}")
     
@@ -92,117 +211,160 @@ async def scrape_profile_data(page: Page, profile_url: str) -> Dict[str, str]:
         logging.info(f"Successfully loaded profile page: {profile_url}")
         
         html = await page.content()
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        # Extract jersey name
-        heading_element = soup.find('h1')
-        jersey_name = heading_element.find('strong').get_text(strip=True) if heading_element and heading_element.find('strong') else "Unknown"
-        logging.info(f"Extracted jersey_name: {jersey_name}")
-        
-        # Extract full name
-        full_name_element = soup.find('span', string='Name in home country:')
-        full_name = full_name_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if full_name_element else "Unknown"
-        logging.info(f"Extracted full_name: {full_name}")
-        
-        # Extract place of birth
-        place_of_birth_element = soup.find('span', string='Place of birth:')
-        place_of_birth = place_of_birth_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if place_of_birth_element else "Unknown"
-        logging.info(f"Extracted place_of_birth: {place_of_birth}")
-        
-        # Extract position
-        position_element = soup.find('span', string='Position:')
-        position = position_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if position_element else "Unknown"
-        logging.info(f"Extracted position: {position}")
-        
-        # Extract height
-        height_element = soup.find('span', string='Height:')
-        height = height_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if height_element else "Unknown"
-        logging.info(f"Extracted height: {height}")
-
-        # Extract jersey number
-        numjersey_element = soup.find('div', class_='national-career__row')
-        numjersey = numjersey_element.find_next('div', class_='national-career__cell--red').get_text(strip=True) if numjersey_element else "Unknown"
-        logging.info(f"Extracted jersey_number: {numjersey}")
-        
-        profile_data = {
-            "jersey_name": jersey_name,
-            "full_name": full_name,
-            "place_of_birth": place_of_birth,
-            "position": position,
-            "height": height,
-            "jersey_number": numjersey
-        }
+        profile_data = parse_profile(html)
         logging.info(f"Completed profile scrape for {profile_url}: {profile_data}")
         return profile_data
     
     except Exception as e:
         logging.error(f"Error scraping profile {profile_url}: {e}")
-        return {"jersey_name": "Unknown", "full_name": "Unknown", "place_of_birth": "Unknown", "position": "Unknown", "height": "Unknown", "jersey_number": "Unknown"}
+        return dict(UNKNOWN_PROFILE)
+
+async def enrich_profiles(context: BrowserContext, players: List[Dict[str, str]], concurrency: int = PROFILE_CONCURRENCY):
+    """Add profile data to every player, visiting up to `concurrency` profile pages at once.
+
+    Pages come from a small pool in `context`; each player is its own task, so a
+    failing profile only falls back to UNKNOWN_PROFILE for that player, or keeps
+    the profile it already had. Players keep their original order.
+    """
+    to_visit = [player for player in players if player["profile_url"] != "Unknown"]
+    pages = asyncio.Queue()
+    for _ in range(max(1, min(concurrency, len(to_visit)))):
+        pages.put_nowait(await context.new_page())
 
-async def get_pagination_urls(page: Page, base_url: str) -> List[str]:
-    """Collect all pagination URLs."""
-    pagination_urls = [base_url]
+    async def enrich(player: Dict[str, str]) -> Dict[str, str]:
+        if player["profile_url"] == "Unknown":
+            return dict(UNKNOWN_PROFILE)
+        page = await pages.get()
+        try:
+            return await scrape_profile_data(page, player["profile_url"])
+        except Exception as e:
+            logging.error(f"Error scraping profile {player['profile_url']}: {e}")
+            return dict(UNKNOWN_PROFILE)
+        finally:
+            # Halaman yang tertutup karena error diganti supaya pool tidak menyusut
+            if page.is_closed():
+                page = await context.new_page()
+            pages.put_nowait(page)
+
+    results = await asyncio.gather(*(enrich(player) for player in players))
+    scraped = date.today().isoformat()
+    for player, profile_data in zip(players, results):
+        if has_profile(profile_data):
+            player.update(profile_data)
+            player["profile_scraped"] = scraped
+        elif not has_profile(player):
+            player.update(profile_data)
+
+    while not pages.empty():
+        await pages.get_nowait().close()
+    logging.info(f"Enriched {len(to_visit)} profiles with {concurrency} pages")
+
+async def enrich_leaderboard_profiles(context: BrowserContext, players: List[Dict[str, str]], stored: List[Dict[str, str]], top_n: int = PROFILE_TOP_N) -> int:
+    """Give players their stored profile and fetch only the missing or stale ones of leaderboard candidates.
+
+    `stored` are the club's previously saved rows. A candidate's stored
+    profile is reused only while profile_is_fresh(); otherwise it is fetched
+    again. Players outside the top `top_n` of every leaderboard keep their
+    stored profile or UNKNOWN_PROFILE; they are backfilled once they make a
+    leaderboard. Returns the number of profiles fetched.
+    """
+    known = {player["profile_url"]: player for player in stored
+             if player.get("profile_url", "Unknown") != "Unknown" and has_profile(player)}
+    fresh = {profile_url for profile_url, player in known.items() if profile_is_fresh(player)}
+    for player in players:
+        stored_player = known.get(player["profile_url"])
+        if stored_player is None:
+            player.update(UNKNOWN_PROFILE)
+            player["profile_scraped"] = ""
+        else:
+            player.update({field: stored_player.get(field, "Unknown") for field in UNKNOWN_PROFILE})
+            player["profile_scraped"] = stored_player.get("profile_scraped", "")
+    
+    candidates = [players[i] for i in leaderboard_candidates(players, top_n)]
+    missing = [player for player in candidates if player["profile_url"] != "Unknown" and player["profile_url"] not in fresh]
+    if missing:
+        await enrich_profiles(context, missing)
+    stale = sum(1 for player in missing if player["profile_url"] in known)
+    logging.info(f"{len(candidates)} of {len(players)} players can make a leaderboard: {len(candidates) - len(missing)} profiles reused, "
+                 f"{len(missing)} fetched ({stale} incomplete or older than {PROFILE_MAX_AGE_DAYS:g} days)")
+    return len(missing)
+
+async def scrape_table_pages(page: Page, base_url: str, use_pagination: bool = True) -> List[Dict[str, str]]:
+    """Extract the table rows of every page, following the next link in one pass."""
+    all_data = []
+    visited = []
     current_url = base_url
     
     try:
-        while True:
-            await page.goto(current_url, wait_until="domcontentloaded")
+        while current_url:
+            await page.goto(current_url, wait_until="domcontentloaded", timeout=60000)
+            visited.append(current_url)
+            html = await page.content()
+            logging.info(f"Scraping table data from: {current_url}")
+            all_data.extend(extract_table_data(html, current_url))
+            if not use_pagination:
+                break
+            
+            # Link halaman berikutnya dibaca dari halaman yang sudah terbuka, jadi tiap halaman cukup dikunjungi sekali
             next_button = await page.query_selector("li.tm-pagination__list-item--icon-next-page a.tm-pagination__link")
-            if next_button:
-                next_url = await next_button.get_attribute("href")
-                if next_url:
-                    full_next_url = urljoin(current_url, next_url)
-                    if full_next_url not in pagination_urls:
-                        pagination_urls.append(full_next_url)
-                        current_url = full_next_url
-                        logging.info(f"Found pagination URL: {current_url}")
-                    else:
-                        logging.info("Duplicate pagination URL found, stopping")
-                        break
-                else:
-                    logging.info("No valid next URL found")
-                    break
-            else:
+            next_url = await next_button.get_attribute("href") if next_button else None
+            if not next_url:
                 logging.info("No more pagination pages")
                 break
+            current_url = urljoin(current_url, next_url)
+            if current_url in visited:
+                logging.info("Duplicate pagination URL found, stopping")
+                break
+            logging.info(f"Found pagination URL: {current_url}")
     except Exception as e:
-        logging.error(f"Error collecting pagination URLs from {current_url}: {e}")
+        logging.error(f"Error scraping table page {current_url}: {e}")
     
-    return pagination_urls
+    logging.info(f"Scraped {len(all_data)} players from {len(visited)} table pages")
+    return all_data
 
 async def scrape_page(page: Page, url: str, use_pagination: bool = True) -> List[Dict[str, str]]:
     """Scrape data from all pages."""
     all_data = []
     
     try:
-        urls_to_scrape = [url]
-        if use_pagination:
-            urls_to_scrape = await get_pagination_urls(page, url)
-        
-        for page_url in urls_to_scrape:
-            await page.goto(page_url, wait_until="domcontentloaded", timeout=60000)
-            html = await page.content()
-            logging.info(f"Scraping table data from: {page_url}")
-            data = extract_table_data(html, page_url)
-            all_data.extend(data)
+        all_data = await scrape_table_pages(page, url, use_pagination)
         
-        for player in all_data:
-            if player["profile_url"] != "Unknown":
-                profile_data = await scrape_profile_data(page, player["profile_url"])
-                player.update(profile_data)
-            else:
-                player.update({"jersey_name": "Unknown", "full_name": "Unknown", "place_of_birth": "Unknown", "position": "Unknown", "height": "Unknown", "jersey_number": "Unknown"})
-                
+        # Profil pemain diambil paralel lewat beberapa halaman di context yang sama, hanya untuk kandidat leaderboard
+        if all_data:
+            stored = read_dataset(dataset_path(all_data[0]["club"])) if PROFILE_TOP_N > 0 else []
+            await enrich_leaderboard_profiles(page.context, all_data, stored)
+
     except Exception as e:
         logging.error(f"Error scraping {url}: {e}")
     
     return all_data
 
-def save_to_csv(data: List[Dict[str, str]], club_name: str):
-    """Save scraped data to CSV file."""
+def dataset_path(club_name: str) -> str:
+    return os.path.join("dataset", f"{club_name.replace(' ', '_').lower()}_players_data.csv")
+
+def read_dataset(filepath: str) -> List[Dict[str, str]]:
+    """Players of a CSV written by save_to_csv, keyed like scraped rows; [] if there is none.
+
+    A leading BOM (files re-saved from Excel) is skipped, so the first column stays `name`.
+    """
+    try:
+        with open(filepath, mode="r", newline="", encoding="utf-8-sig") as file:
+            players = list(csv.DictReader(file))
+    except FileNotFoundError:
+        return []
+    except UnicodeDecodeError:
+        # File yang pernah disunting di Excel tidak selalu UTF-8
+        with open(filepath, mode="r", newline="", encoding="latin-1") as file:
+            players = list(csv.DictReader(file))
+    for player in players:
+        player["sub_on"] = player.pop("substituted_on", "")
+        player["sub_off"] = player.pop("substituted_off", "")
+    return players
+
+def save_to_csv(data: List[Dict[str, str]], club_name: str, filepath: Optional[str] = None):
+    """Save scraped data to CSV file (the club's dataset_path unless `filepath` is given)."""
     os.makedirs("dataset", exist_ok=True)
-    filename = f"{club_name.replace(' ', '_').lower()}_players_data.csv"
-    filepath = os.path.join("dataset", filename)
+    filepath = filepath or dataset_path(club_name)
     
     with open(filepath, mode="w", newline="", encoding="utf-8") as file:
         writer = csv.writer(file)
@@ -211,7 +373,7 @@ def save_to_csv(data: List[Dict[str, str]], club_name: str):
             "nation", "nation_code", "club", "place_of_birth", "full_name", "position",
             "height", "date_of_birth", "appearances", "goals", "assists", "own_goals",
             "yellow_cards", "second_yellow", "red_cards", "substituted_on", "substituted_off",
-            "minutes_played"
+            "minutes_played", "foot", "player_agent", "contract_expires", "citizenship", "profile_scraped"
         ])
         for player in data:
             writer.writerow([
@@ -220,31 +382,74 @@ def save_to_csv(data: List[Dict[str, str]], club_name: str):
                 player["club"], player["place_of_birth"], player["full_name"], player["position"],
                 player["height"], player["date_of_birth"], player["appearances"], player["goals"],
                 player["assists"], player["own_goals"], player["yellow_cards"], player["second_yellow"],
-                player["red_cards"], player["sub_on"], player["sub_off"], player["minutes_played"]
+                player["red_cards"], player["sub_on"], player["sub_off"], player["minutes_played"],
+                player["foot"], player["player_agent"], player["contract_expires"], player["citizenship"],
+                player.get("profile_scraped", "")
             ])
     logging.info(f"Data saved to {filepath}")
 
-async def scrape_multiple_urls(file_path: str, use_pagination: bool = True):
-    """Scrape multiple URLs from file."""
+async def scrape_multiple_urls(file_path: str, use_pagination: bool = True, concurrency: int = CLUB_CONCURRENCY):
+    """Scrape every club in the file, several at once, saving each club's CSV as soon as it is done."""
+    with open(file_path, "r") as file:
+        urls = [line.strip() for line in file.readlines() if line.strip()]
+    
+    queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    saved = []
+    
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+        context = await browser.new_context()
         
-        with open(file_path, "r") as file:
-            urls = [line.strip() for line in file.readlines() if line.strip()]
+        async def worker():
+            # Tiap worker punya halaman tabel sendiri dan mengambil klub berikutnya dari antrian
+            page = await context.new_page()
+            while not queue.empty():
+                url = queue.get_nowait()
+                logging.info(f"Scraping URL: {url}")
+                if page.is_closed():
+                    page = await context.new_page()
+                data = await scrape_page(page, url, use_pagination)
+                if not data:
+                    logging.warning(f"No players scraped from {url}")
+                    continue
+                try:
+                    save_to_csv(data, data[0].get("club", "unknown_club"))
+                    saved.append(url)
+                except Exception as e:
+                    logging.error(f"Error saving data from {url}: {e}")
+            await page.close()
         
-        all_data = []
-        for url in urls:
-            logging.info(f"Scraping URL: {url}")
-            data = await scrape_page(page, url, use_pagination)
-            all_data.extend(data)
+        await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(urls))))))
+        await browser.close()
+    
+    logging.info(f"Saved {len(saved)} of {len(urls)} clubs")
+
+async def backfill_profiles(dataset_folder: str = "dataset", top_n: int = PROFILE_TOP_N):
+    """Fetch the missing profiles of players who now make a leaderboard in the saved dataset CSVs."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        context = await browser.new_context()
         
-        if all_data:
-            club_name = all_data[0]["club"] if "club" in all_data[0] else "unknown_club"
-            save_to_csv(all_data, club_name)
+        for filename in sorted(os.listdir(dataset_folder)):
+            if not filename.endswith("_players_data.csv"):
+                continue
+            filepath = os.path.join(dataset_folder, filename)
+            players = read_dataset(filepath)
+            if not players:
+                continue
+            logging.info(f"Backfilling profiles in {filename}")
+            if await enrich_leaderboard_profiles(context, players, players, top_n):
+                # Ditulis kembali ke file yang sama, meski namanya tidak persis dataset_path(klub)
+                save_to_csv(players, players[0]["club"], filepath)
         
         await browser.close()
 
 if __name__ == "__main__":
     urls_file = "urls.txt"
-    asyncio.run(scrape_multiple_urls(urls_file, use_pagination=True))
\ No newline at end of file
+    # PROFILE_BACKFILL=1 hanya melengkapi profil kandidat leaderboard di dataset/ tanpa scrape tabel ulang
+    if os.environ.get('PROFILE_BACKFILL') == '1':
+        asyncio.run(backfill_profiles("dataset"))
+    else:
+        asyncio.run(scrape_multiple_urls(urls_file, use_pagination=True))
\ No newline at end of file
@@ -4,14 +4,34 @@ import re
 import os
 import logging
 from urllib.parse import urljoin
-from playwright.async_api import async_playwright, Page
+from playwright.async_api import async_playwright, BrowserContext, Page
 from typing import List, Dict, Tuple
 from bs4 import BeautifulSoup
+from bs4.filter import ElementFilter
 import pycountry
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Jumlah halaman profil yang dibuka bersamaan saat melengkapi data pemain (bisa diatur lewat environment variable)
+PROFILE_CONCURRENCY = int(os.environ.get('PROFILE_CONCURRENCY', '4'))
+
+# Data profil untuk pemain tanpa URL profil atau yang profilnya gagal diambil
+UNKNOWN_PROFILE = {"jersey_name": "Unknown", "full_name": "Unknown", "place_of_birth": "Unknown", "position": "Unknown", "height": "Unknown", "jersey_number": "Unknown",
+                   "foot": "Unknown", "player_agent": "Unknown", "contract_expires": "Unknown", "citizenship": "Unknown"}
+
+# Label di info-table halaman profil -> kolom dataset; semua label terbaca dalam satu kali jalan, jadi kolom tambahan tidak menambah biaya
+INFO_TABLE_FIELDS = {
+    "Name in home country:": "full_name",
+    "Place of birth:": "place_of_birth",
+    "Position:": "position",
+    "Height:": "height",
+    "Foot:": "foot",
+    "Player agent:": "player_agent",
+    "Contract expires:": "contract_expires",
+    "Citizenship:": "citizenship",
+}
+
 def get_country_code(country_name: str) -> str:
     """Convert country name to country code."""
     try:
@@ -86,43 +106,106 @@ def extract_table_data(html: str, base_url: str) -> List[Dict[str, str]]:
     
     return players_list
 
+class ProfileFilter(ElementFilter):
+    """Build only the parts of a profile page parse_profile() reads: the heading, the info-table and the national-career rows."""
+    CLASSES = {"info-table", "national-career__row"}
+    
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        if name == "h1":
+            return True
+        classes = (attrs or {}).get("class", "")
+        if not isinstance(classes, str):
+            classes = " ".join(classes)
+        return name == "div" and not self.CLASSES.isdisjoint(classes.split())
+    
+    def allow_string_creation(self, string) -> bool:
+        # Teks di dalam elemen yang disimpan tetap dibuat; teks di luarnya tidak dibutuhkan
+        return False
+
+def parse_info_table(soup: BeautifulSoup) -> Dict[str, str]:
+    """Every label -> value pair of the profile's info-table, read in one walk over its spans."""
+    info = {}
+    table = soup.find('div', class_='info-table')
+    if table is None:
+        return info
+    
+    label = None
+    for span in table.find_all('span', class_='info-table__content'):
+        classes = span.get('class', [])
+        if 'info-table__content--regular' in classes:
+            label = span.get_text(strip=True)
+        elif 'info-table__content--bold' in classes and label is not None:
+            if label == "Citizenship:":
+                # Tiap kewarganegaraan punya bendera dengan nama negara di alt
+                info[label] = ", ".join(img['alt'] for img in span.find_all('img', alt=True)) or span.get_text(strip=True)
+            else:
+                info[label] = span.get_text(strip=True)
+            label = None
+    return info
+
+def parse_profile(html: str) -> Dict[str, str]:
+    """Profile fields of a player page: the heading, the national-career shirt number and the info-table."""
+    soup = BeautifulSoup(html, 'html.parser', parse_only=ProfileFilter())
+    
+    heading_element = soup.find('h1')
+    jersey_name = heading_element.find('strong').get_text(strip=True) if heading_element and heading_element.find('strong') else "Unknown"
+    
+    numjersey_element = soup.find('div', class_='national-career__row')
+    numjersey = numjersey_element.find_next('div', class_='national-career__cell--red').get_text(strip=True) if numjersey_element else "Unknown"
+    
+    info = parse_info_table(soup)
+    profile_data = {"jersey_name": jersey_name, "jersey_number": numjersey}
+    for label, field in INFO_TABLE_FIELDS.items():
+        profile_data[field] = info.get(label, "Unknown")
+    return profile_data
+
 async def scrape_profile_data(page: Page, profile_url: str) -> Dict[str, str]:
     """Scrape additional data from player's profile page."""
     if profile_url == "Unknown":
-        return {"profile_heading": "Unknown", "place_of_birth": "Unknown", "position": "Unknown"}
+        return dict(UNKNOWN_PROFILE)
     
     try:
         await page.goto(profile_url, wait_until="domcontentloaded")
         html = await page.content()
-        soup = BeautifulSoup(html, 'html.parser')
-        
-        heading_element = soup.find('h1')
-        heading = heading_element.find('strong').get_text(strip=True) if heading_element and heading_element.find('strong') else "Unknown"
-        
-        # Extract full name
-        full_name_element = soup.find('span', string='Name in home country:')
-        full_name = full_name_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if full_name_element else "Unknown"
-        
-        # Extract place of birth
-        place_of_birth_element = soup.find('span', string='Place of birth:')
-        place_of_birth = place_of_birth_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if place_of_birth_element else "Unknown"
-        
-        # Extract position
-        position_element = soup.find('span', string='Position:')
-        position = position_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if position_element else "Unknown"
-        
-        # Extract height
-        height_element = soup.find('span', string='Height:')
-        height = height_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if height_element else "Unknown"
-
-        # Extract number jersey
-        numjersey_element = soup.find('div', class_='national-career__row')
-        numjersey = numjersey_element.find_next('div', class_='national-career__cell--red').get_text(strip=True) if numjersey_element else "Unknown"
-        
-        return {"jersey_name": heading, "full_name": full_name, "place_of_birth": place_of_birth, "position": position, "height": height, "jersey_number": numjersey}
+        return parse_profile(html)
     except Exception as e:
         logging.error(f"Error scraping profile {profile_url}: {e}")
-        return {"jersey_name": "Unknown", "full_name": "Unknown", "place_of_birth": "Unknown", "position": "Unknown", "height": "Unknown", "jersey_number": "Unknown"}
+        return dict(UNKNOWN_PROFILE)
+
+async def enrich_profiles(context: BrowserContext, players: List[Dict[str, str]], concurrency: int = PROFILE_CONCURRENCY):
+    """Add profile data to every player, visiting up to `concurrency` profile pages at once.
+
+    Pages come from a small pool in `context`; each player is its own task, so a
+    failing profile only falls back to UNKNOWN_PROFILE for that player. Players
+    keep their original order.
+    """
+    to_visit = [player for player in players if player["profile_url"] != "Unknown"]
+    pages = asyncio.Queue()
+    for _ in range(max(1, min(concurrency, len(to_visit)))):
+        pages.put_nowait(await context.new_page())
+
+    async def enrich(player: Dict[str, str]) -> Dict[str, str]:
+        if player["profile_url"] == "Unknown":
+            return dict(UNKNOWN_PROFILE)
+        page = await pages.get()
+        try:
+            return await scrape_profile_data(page, player["profile_url"])
+        except Exception as e:
+            logging.error(f"Error scraping profile {player['profile_url']}: {e}")
+            return dict(UNKNOWN_PROFILE)
+        finally:
+            # Halaman yang tertutup karena error diganti supaya pool tidak menyusut
+            if page.is_closed():
+                page = await context.new_page()
+            pages.put_nowait(page)
+
+    results = await asyncio.gather(*(enrich(player) for player in players))
+    for player, profile_data in zip(players, results):
+        player.update(profile_data)
+
+    while not pages.empty():
+        await pages.get_nowait().close()
+    logging.info(f"Enriched {len(to_visit)} profiles with {concurrency} pages")
 
 async def scrape_page(url: str) -> List[Dict[str, str]]:  # Removed use_pagination parameter
     async with async_playwright() as p:
@@ -138,13 +221,8 @@ async def scrape_page(url: str) -> List[Dict[str, str]]:  # Removed use_paginati
             logging.info(f"Scraped URL: {current_url}")
             data = extract_table_data(html, current_url)
             
-            # Scrape additional profile data
-            for player in data:
-                if player["profile_url"] != "Unknown":
-                    profile_data = await scrape_profile_data(page, player["profile_url"])
-                    player.update(profile_data)
-                else:
-                    player.update({"jersey_name": "Unknown", "place_of_birth": "Unknown", "position": "Unknown"})
+            # Scrape additional profile data, beberapa halaman profil sekaligus
+            await enrich_profiles(page.context, data)
             
             all_data.extend(data)
         except Exception as e:
@@ -184,7 +262,11 @@ def save_to_csv(data: List[Dict[str, str]], club_name: str):
             "red_cards", 
             "substituted_on", 
             "substituted_off", 
-            "minutes_played"
+            "minutes_played",
+            "foot",
+            "player_agent",
+            "contract_expires",
+            "citizenship"
             ])
         for player in data:
             writer.writerow([
@@ -211,7 +293,11 @@ def save_to_csv(data: List[Dict[str, str]], club_name: str):
                 player["red_cards"], 
                 player["sub_on"], 
                 player["sub_off"], 
-                player["minutes_played"]
+                player["minutes_played"],
+                player["foot"],
+                player["player_agent"],
+                player["contract_expires"],
+                player["citizenship"]
                 ])
     
     logging.info(f"Data saved to {filepath}")
@@ -5,8 +5,12 @@ import json
 # Folder dataset
 dataset_folder = "dataset"
 
-# Dictionary untuk menyimpan klub
+# club_list.json juga registri alias klub (dibaca period_engine.aliases); alias yang sudah ada dipertahankan
+output_file = "club_list.json"
 club_mapping = {}
+if os.path.exists(output_file):
+    with open(output_file, "r", encoding="utf-8") as f:
+        club_mapping = json.load(f)
 
 # Loop semua file CSV dalam folder dataset
 for filename in os.listdir(dataset_folder):
@@ -21,12 +25,11 @@ for filename in os.listdir(dataset_folder):
             # Ambil semua nama klub yang unik dalam satu file
             unique_clubs = df["club"].dropna().unique()
 
-            # Tambahkan ke dictionary dengan daftar kosong, ubah ke huruf kecil
+            # Klub baru ditambahkan dengan daftar alias kosong, ubah ke huruf kecil
             for club in unique_clubs:
-                club_mapping[club.lower()] = []
+                club_mapping.setdefault(club.lower(), [])
 
 # Simpan ke file JSON
-output_file = "club_list.json"
 with open(output_file, "w", encoding="utf-8") as f:
     json.dump(club_mapping, f, indent=2, ensure_ascii=False)
 
@@ -0,0 +1,50 @@
+import os
+import sys
+
+# Belajar alias klub dari riwayat transfer yang sudah di-cache, untuk semua folder 1-tranfermarkt-*
+base_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, base_path)
+from period_engine.alias_learning import PROPOSALS_FILE, AliasLearner, write_proposals
+from period_engine.aliases import AliasRegistry, add_aliases
+from period_engine.leagues import discover_leagues
+from period_engine.player_registry import PlayerRegistry
+
+# Batasi ke liga tertentu, dipisah koma (misal PERIOD_LEAGUES=1-tranfermarkt-france,1-tranfermarkt-spain)
+LEAGUES = [name.strip() for name in os.environ.get('PERIOD_LEAGUES', '').split(',') if name.strip()]
+
+# Ejaan harus muncul minimal ALIAS_MIN_SUPPORT kali; ALIAS_APPLY=1 langsung menambahkan usulan dengan
+# keyakinan >= ALIAS_MIN_CONFIDENCE ke club_list.json (selain itu hanya ditulis ke club_aliases.proposed.json)
+MIN_SUPPORT = int(os.environ.get('ALIAS_MIN_SUPPORT', '2'))
+MIN_CONFIDENCE = float(os.environ.get('ALIAS_MIN_CONFIDENCE', '0.8'))
+APPLY = os.environ.get('ALIAS_APPLY') == '1'
+
+league_dirs = discover_leagues(base_path, 'check')
+if LEAGUES:
+    league_dirs = [folder for folder in league_dirs if os.path.basename(folder) in LEAGUES]
+
+# Riwayat transfer dari cache bersama semua liga (cache lama per liga disalin dulu ke sana);
+# ejaan klub dan ID klub sama di semua liga, jadi setiap liga belajar dari semua riwayat
+player_registry = PlayerRegistry.shared(base_path)
+for folder in league_dirs:
+    player_registry.adopt(os.path.join(folder, 'cache', 'transfers'))
+histories = [transfers for _, transfers in player_registry.cache.histories()]
+if not histories:
+    print("No cached transfer histories.")
+    exit()
+
+for folder in league_dirs:
+    name = os.path.basename(folder)
+    learner = AliasLearner(AliasRegistry.load(folder))
+    for transfers in histories:
+        learner.observe(transfers)
+    proposals = learner.proposals(min_support=MIN_SUPPORT)
+    write_proposals(os.path.join(folder, PROPOSALS_FILE), proposals)
+    print(f"{name}: {learner.summary(proposals)}")
+    for proposal in proposals[:10]:
+        print(f"  {proposal.alias!r} -> {proposal.canonical!r} "
+              f"(confidence {proposal.confidence:.2f}, seen {proposal.support}x, club ID {proposal.club_id})")
+
+    if APPLY:
+        accepted = [(proposal.canonical, proposal.alias) for proposal in proposals
+                    if proposal.confidence >= MIN_CONFIDENCE]
+        print(f"  {add_aliases(accepted, folder)} aliases added to club_list.json")
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import sys
+import time
+
+# Satu run untuk semua liga: semua folder 1-tranfermarkt-* memakai satu browser bersama
+base_path = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, base_path)
+from period_engine.browser_pool import AsyncPagePool
+from period_engine.context_profile import LightweightProfile
+from period_engine.leagues import LeagueJob, discover_leagues
+from period_engine.player_registry import PlayerRegistry
+from period_engine.timing import timer
+
+# Jenis job: get (_get_period, tulis period/<klub>.csv) atau check (_check_period, laporan drift)
+JOB = os.environ.get('PERIOD_JOB', 'get')
+
+# Batasi ke liga tertentu, dipisah koma (misal PERIOD_LEAGUES=1-tranfermarkt-france,1-tranfermarkt-spain)
+LEAGUES = [name.strip() for name in os.environ.get('PERIOD_LEAGUES', '').split(',') if name.strip()]
+
+# Batas global untuk semua liga sekaligus: jumlah halaman aktif dan jumlah request per detik
+CONCURRENCY = int(os.environ.get('PERIOD_CONCURRENCY', '8'))
+RATE_LIMIT = float(os.environ.get('PERIOD_RATE', '2'))
+
+# Pengaturan yang sama dengan script per liga
+FETCH_MODE = os.environ.get('PERIOD_FETCH_MODE', 'api')
+CACHE_TTL_DAYS = float(os.environ.get('PERIOD_CACHE_TTL_DAYS', '30'))
+FORCE_REFRESH = os.environ.get('PERIOD_FORCE_REFRESH') == '1'
+RESUME = os.environ.get('PERIOD_RESUME') == '1'
+CHECK_SAMPLE = int(os.environ.get('PERIOD_CHECK_SAMPLE', '1'))
+CHECK_STRATEGY = os.environ.get('PERIOD_CHECK_STRATEGY', 'first')
+CHECK_SEED = os.environ.get('PERIOD_CHECK_SEED')
+DRIFT_THRESHOLD = float(os.environ.get('PERIOD_DRIFT_THRESHOLD', '0.1'))
+CHECK_USE_CACHE = os.environ.get('PERIOD_CHECK_USE_CACHE') == '1'
+context_profile = LightweightProfile() if os.environ.get('PERIOD_BLOCK_RESOURCES', '1') == '1' else None
+if os.environ.get('PERIOD_TIMING_JSONL'):
+    timer.dump_to(os.environ['PERIOD_TIMING_JSONL'])
+
+
+async def run_all(jobs):
+    async with AsyncPagePool(size=CONCURRENCY, profile=context_profile, rate_limit=RATE_LIMIT) as page_pool:
+        results = await asyncio.gather(*(job.run(page_pool) for job in jobs), return_exceptions=True)
+        waited = page_pool.rate_limiter.waited if page_pool.rate_limiter is not None else 0.0
+    return results, waited
+
+
+league_dirs = discover_leagues(base_path, JOB)
+if LEAGUES:
+    league_dirs = [folder for folder in league_dirs if os.path.basename(folder) in LEAGUES]
+
+if not league_dirs:
+    print(f"No league folders found for job '{JOB}'.")
+    exit()
+
+print(f"Running '{JOB}' for {len(league_dirs)} leagues with {CONCURRENCY} pages, {RATE_LIMIT} requests/s")
+# Registri pemain lintas liga: satu cache riwayat transfer untuk semua liga, pemain yang sama diambil sekali
+player_registry = PlayerRegistry.shared(base_path, ttl_days=CACHE_TTL_DAYS, force_refresh=FORCE_REFRESH)
+jobs = [
+    LeagueJob(folder, JOB, fetch_mode=FETCH_MODE, cache_ttl_days=CACHE_TTL_DAYS, force_refresh=FORCE_REFRESH,
+              resume=RESUME, sample_size=CHECK_SAMPLE, sample_strategy=CHECK_STRATEGY,
+              seed=int(CHECK_SEED) if CHECK_SEED else None, drift_threshold=DRIFT_THRESHOLD,
+              player_registry=player_registry, check_cached=CHECK_USE_CACHE)
+    for folder in league_dirs
+]
+for job in jobs:
+    player_registry.register(job.name, job.players())
+player_registry.save()
+print(player_registry.summary())
+
+started = time.perf_counter()
+results, waited = asyncio.run(run_all(jobs))
+
+# Ringkasan per liga; liga yang gagal tidak menghentikan liga lain
+print("\nSummary:")
+for job, result in zip(jobs, results):
+    if isinstance(result, BaseException):
+        print(f"{job.name}: FAILED ({result})")
+    else:
+        print(result)
+print(player_registry.summary())
+if context_profile is not None:
+    print(context_profile.summary())
+print(timer.summary())
+timer.close()
+print(f"Finished {len(jobs)} leagues in {time.perf_counter() - started:.1f}s "
+      f"({waited:.1f}s of page waits added by the rate limit)")
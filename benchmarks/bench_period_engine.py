@@ -0,0 +1,180 @@
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+
+# Benchmark offline untuk period_engine: parsing riwayat transfer, pencocokan klub & perhitungan periode.
+# Tidak ada akses jaringan; semua data berasal dari benchmarks/fixtures.
+base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, base_path)
+from period_engine.alias_learning import AliasLearner
+from period_engine.aliases import AliasRegistry
+from period_engine.clubs import ClubMatcher
+from period_engine.periods import format_periods, get_period_in_club
+from period_engine.records import Transfer
+from period_engine.timeline import build_career_timeline
+from period_engine.transfers import parse_transfer_history, parse_transfer_payload
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# Jumlah replay sintetis per benchmark, seed acak, dan filter nama benchmark (dipisah koma)
+REPLAYS = int(os.environ.get('BENCH_REPLAYS', '2000'))
+SEED = int(os.environ.get('BENCH_SEED', '1'))
+ONLY = [name.strip() for name in os.environ.get('BENCH_ONLY', '').split(',') if name.strip()]
+
+# Nama klub pengganti untuk replay sintetis
+CLUB_POOL = [
+    'Persib Bandung', 'Persija Jakarta', 'Arema FC', 'Bali United', 'PSM Makassar', 'Borneo FC',
+    'Olympique Lyon', 'Olympique Marseille', 'LOSC Lille', 'AS Monaco', 'Paris Saint-Germain',
+    'SL Benfica', 'Sporting CP', 'FC Porto', 'SC Braga', 'Manchester United', 'Everton FC',
+    'Tottenham Hotspur', 'Arsenal FC', 'Chelsea FC', 'Boca Juniors', 'River Plate', 'Racing Club',
+    'Real Madrid', 'Sevilla FC', 'Valencia CF', 'LA Galaxy', 'Inter Miami CF', 'Al-Nassr FC', 'Al-Hilal SFC',
+]
+MARKERS = {'Retired', 'Without Club', 'Career break'}
+
+
+def load_fixtures():
+    with open(os.path.join(FIXTURES, 'players.json'), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    fixtures = []
+    for slug, info in index['players'].items():
+        with open(os.path.join(FIXTURES, f"{slug}.html"), 'r', encoding='utf-8') as f:
+            html = f.read()
+        with open(os.path.join(FIXTURES, f"{slug}.json"), 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+        fixtures.append({'slug': slug, 'html': html, 'payload': payload, **info})
+    return index['aliases'], fixtures
+
+
+def check_fixtures(matcher, fixtures):
+    """Both parsers must agree and every expected period must come out, before anything is timed."""
+    this_year = str(datetime.now().year)
+    for fixture in fixtures:
+        from_html = parse_transfer_history(fixture['html'])
+        from_payload = parse_transfer_payload(fixture['payload'])
+        if from_html != from_payload:
+            raise SystemExit(f"{fixture['slug']}: page and payload parse differently")
+        for club, expected in fixture['expected'].items():
+            actual = format_periods(get_period_in_club(from_payload, club, matcher))
+            if actual != expected.replace('NOW', this_year):
+                raise SystemExit(f"{fixture['slug']} at {club}: expected {expected}, got {actual}")
+
+
+def check_learning(aliases, fixtures):
+    """With every alias list emptied, the learner must win back the aliases the fixtures link to a club ID."""
+    learner = AliasLearner(AliasRegistry({club: [] for club in aliases}))
+    seen = set()
+    for fixture in fixtures:
+        transfers = parse_transfer_payload(fixture['payload'])
+        learner.observe(transfers)
+        seen.update(key for transfer in transfers for key in (transfer.old_key, transfer.new_key))
+    learned = {(proposal.canonical, proposal.alias) for proposal in learner.proposals(min_support=1)}
+    for club, listed in aliases.items():
+        for alias in listed:
+            if alias in seen and (club, alias) not in learned:
+                raise SystemExit(f"alias {alias!r} of {club} was not learned")
+
+
+def synthetic_replays(fixtures, count, rng):
+    """Histories with the fixtures' shapes (loans, retirements, repeat stints) but other clubs and years."""
+    replays = []
+    for i in range(count):
+        source = parse_transfer_payload(fixtures[i % len(fixtures)]['payload'])
+        renamed = {}
+        shift = rng.randint(-10, 5)
+        transfers = []
+        for transfer in source:
+            def rename(club):
+                if club in MARKERS:
+                    return club
+                if club not in renamed:
+                    renamed[club] = rng.choice(CLUB_POOL)
+                return renamed[club]
+            when = transfer.when.replace(year=transfer.when.year + shift)
+            transfers.append(Transfer(transfer.season, when.strftime('%b %d, %Y'),
+                                      rename(transfer.old_club), rename(transfer.new_club)))
+        target = rng.choice([club for club in renamed.values()] or CLUB_POOL)
+        replays.append((transfers, target))
+    return replays
+
+
+def measure(name, fn, items):
+    """Run `fn` over `items` once for timing and once under tracemalloc; returns one report row."""
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = time.perf_counter() - started
+
+    sample = items[:min(len(items), 500)]
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for item in sample:
+        fn(item)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (name, len(items), elapsed, len(items) / elapsed if elapsed else float('inf'),
+            (peak - baseline) / 1024, (current - baseline) / len(sample) if sample else 0.0)
+
+
+aliases, fixtures = load_fixtures()
+check_fixtures(ClubMatcher(aliases), fixtures)
+check_learning(aliases, fixtures)
+rng = random.Random(SEED)
+replays = synthetic_replays(fixtures, REPLAYS, rng)
+pages = [fixtures[i % len(fixtures)]['html'] for i in range(REPLAYS)]
+payloads = [fixtures[i % len(fixtures)]['payload'] for i in range(REPLAYS)]
+club_names = sorted({club for transfers, _ in replays for transfer in transfers
+                     for club in (transfer.old_club, transfer.new_club)})
+memo_matcher = ClubMatcher(aliases)
+registry = AliasRegistry(aliases)
+histories = [parse_transfer_payload(payload) for payload in payloads]
+
+
+def match_cold(replay):
+    transfers, target = replay
+    matcher = ClubMatcher(aliases)
+    for transfer in transfers:
+        matcher.is_match(transfer.new_club, target)
+
+
+def match_memo(replay):
+    transfers, target = replay
+    for transfer in transfers:
+        memo_matcher.is_match(transfer.new_club, target)
+
+
+def match_batch(_):
+    with redirect_stdout(io.StringIO()):
+        ClubMatcher(aliases).resolve_batch(club_names, CLUB_POOL)
+
+
+def learn(_):
+    learner = AliasLearner(registry)
+    for transfers in histories:
+        learner.observe(transfers)
+    learner.proposals()
+
+
+benchmarks = {
+    'parse_html': (lambda html: parse_transfer_history(html), pages),
+    'parse_payload': (lambda payload: parse_transfer_payload(payload), payloads),
+    'match_cold': (match_cold, replays),
+    'match_memo': (match_memo, replays),
+    'match_batch': (match_batch, [None] * 5),
+    'periods': (lambda replay: get_period_in_club(replay[0], replay[1], memo_matcher), replays),
+    'timeline': (lambda replay: build_career_timeline(replay[0], memo_matcher), replays),
+    'learn': (learn, [None] * 5),
+}
+
+print(f"{len(fixtures)} fixtures checked, {REPLAYS} replays, seed {SEED}")
+print(f"{'benchmark':<15} {'ops':>7} {'seconds':>9} {'ops/s':>11} {'peak KB':>9} {'B/op kept':>10}")
+for name, (fn, items) in benchmarks.items():
+    if ONLY and name not in ONLY:
+        continue
+    name, ops, elapsed, rate, peak_kb, kept = measure(name, fn, items)
+    print(f"{name:<15} {ops:>7} {elapsed:>9.3f} {rate:>11.0f} {peak_kb:>9.1f} {kept:>10.1f}")
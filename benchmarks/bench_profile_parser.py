@@ -0,0 +1,140 @@
+import importlib.util
+import json
+import os
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+# Benchmark offline untuk parser halaman profil pemain di Pagination.py: cara lama (satu pencarian per field)
+# dibandingkan parse_profile (info-table dibaca sekali). Data berasal dari benchmarks/fixtures/profiles: halaman
+# profil sintetis (struktur heading, info-table dan national-career seperti Transfermarkt, ditambah navigasi pengisi
+# "Nav 0..", bukan halaman yang disimpan dari situs), jadi angka ops/s hanya perbandingan relatif kedua cara.
+base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'profiles')
+SCRAPER = os.path.join(base_path, '1-tranfermarkt-italy', 'Pagination.py')
+
+# Jumlah halaman yang di-parse per benchmark dan filter nama benchmark (dipisah koma)
+REPLAYS = int(os.environ.get('BENCH_REPLAYS', '100'))
+ONLY = [name.strip() for name in os.environ.get('BENCH_ONLY', '').split(',') if name.strip()]
+
+# Dataset yang diawali BOM (disimpan ulang dari Excel); read_dataset harus tetap menemukan kolom name
+BOM_DATASET = os.path.join(base_path, '1-tranfermarkt-italy', 'dataset', 'atalanta_players_data.csv')
+
+# Field yang sudah diambil cara lama; hasil keduanya harus sama
+LEGACY_FIELDS = ['jersey_name', 'full_name', 'place_of_birth', 'position', 'height', 'jersey_number']
+
+
+def load_scraper():
+    spec = importlib.util.spec_from_file_location('pagination', SCRAPER)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_fixtures():
+    with open(os.path.join(FIXTURES, 'profiles.json'), 'r', encoding='utf-8') as f:
+        index = json.load(f)
+    fixtures = []
+    for slug, expected in index['profiles'].items():
+        with open(os.path.join(FIXTURES, f"{slug}.html"), 'r', encoding='utf-8') as f:
+            fixtures.append({'slug': slug, 'html': f.read(), 'expected': expected})
+    return fixtures
+
+
+def legacy_fields(soup):
+    """The field lookups scrape_profile_data() did before parse_profile(), one document scan each."""
+    heading_element = soup.find('h1')
+    jersey_name = heading_element.find('strong').get_text(strip=True) if heading_element and heading_element.find('strong') else "Unknown"
+    full_name_element = soup.find('span', string='Name in home country:')
+    full_name = full_name_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if full_name_element else "Unknown"
+    place_of_birth_element = soup.find('span', string='Place of birth:')
+    place_of_birth = place_of_birth_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if place_of_birth_element else "Unknown"
+    position_element = soup.find('span', string='Position:')
+    position = position_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if position_element else "Unknown"
+    height_element = soup.find('span', string='Height:')
+    height = height_element.find_next('span', class_='info-table__content--bold').get_text(strip=True) if height_element else "Unknown"
+    numjersey_element = soup.find('div', class_='national-career__row')
+    numjersey = numjersey_element.find_next('div', class_='national-career__cell--red').get_text(strip=True) if numjersey_element else "Unknown"
+    return {"jersey_name": jersey_name, "full_name": full_name, "place_of_birth": place_of_birth,
+            "position": position, "height": height, "jersey_number": numjersey}
+
+
+def legacy_profile(html):
+    return legacy_fields(BeautifulSoup(html, 'html.parser'))
+
+
+def single_pass_fields(soup):
+    """parse_profile() minus the parse, so the lookups can be timed on their own."""
+    heading_element = soup.find('h1')
+    numjersey_element = soup.find('div', class_='national-career__row')
+    profile_data = {
+        "jersey_name": heading_element.find('strong').get_text(strip=True) if heading_element and heading_element.find('strong') else "Unknown",
+        "jersey_number": numjersey_element.find_next('div', class_='national-career__cell--red').get_text(strip=True) if numjersey_element else "Unknown",
+    }
+    info = scraper.parse_info_table(soup)
+    for label, field in scraper.INFO_TABLE_FIELDS.items():
+        profile_data[field] = info.get(label, "Unknown")
+    return profile_data
+
+
+def check_fixtures(fixtures):
+    """parse_profile must give every expected field and agree with the old lookups, before anything is timed."""
+    for fixture in fixtures:
+        profile = scraper.parse_profile(fixture['html'])
+        if profile != fixture['expected']:
+            raise SystemExit(f"{fixture['slug']}: expected {fixture['expected']}, got {profile}")
+        legacy = legacy_profile(fixture['html'])
+        for field in LEGACY_FIELDS:
+            if legacy[field] != profile[field]:
+                raise SystemExit(f"{fixture['slug']} {field}: old lookup gives {legacy[field]!r}, parse_profile {profile[field]!r}")
+
+
+def check_dataset(path):
+    """read_dataset must give the save_to_csv keys even for a CSV that starts with a BOM."""
+    players = scraper.read_dataset(path)
+    if not players:
+        raise SystemExit(f"{path}: read_dataset found no players")
+    if 'name' not in players[0]:
+        raise SystemExit(f"{path}: read_dataset gives columns {list(players[0])[:3]}..., expected name first")
+
+
+def measure(name, fn, items):
+    """Run `fn` over `items` once for timing and once under tracemalloc; returns one report row."""
+    started = time.perf_counter()
+    for item in items:
+        fn(item)
+    elapsed = time.perf_counter() - started
+
+    sample = items[:min(len(items), 50)]
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    for item in sample:
+        fn(item)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (name, len(items), elapsed, len(items) / elapsed if elapsed else float('inf'), (peak - baseline) / 1024)
+
+
+scraper = load_scraper()
+fixtures = load_fixtures()
+check_fixtures(fixtures)
+check_dataset(BOM_DATASET)
+pages = [fixtures[i % len(fixtures)]['html'] for i in range(REPLAYS)]
+soups = [BeautifulSoup(fixture['html'], 'html.parser') for fixture in fixtures]
+parsed = [soups[i % len(soups)] for i in range(REPLAYS)]
+
+benchmarks = {
+    'legacy_page': (legacy_profile, pages),
+    'single_page': (lambda html: scraper.parse_profile(html), pages),
+    'legacy_lookup': (legacy_fields, parsed),
+    'single_lookup': (single_pass_fields, parsed),
+}
+
+print(f"{len(fixtures)} profile fixtures checked, {REPLAYS} pages per benchmark")
+print(f"{'benchmark':<15} {'ops':>7} {'seconds':>9} {'ops/s':>11} {'peak KB':>9}")
+for name, (fn, items) in benchmarks.items():
+    if ONLY and name not in ONLY:
+        continue
+    name, ops, elapsed, rate, peak_kb = measure(name, fn, items)
+    print(f"{name:<15} {ops:>7} {elapsed:>9.3f} {rate:>11.0f} {peak_kb:>9.1f}")
@@ -0,0 +1,5 @@
+@echo off
+cd /d "F:\PlayWright"
+call venv\Scripts\activate.bat
+python _learn_aliases.py
+pause
@@ -0,0 +1 @@
+"""Shared transfer-history and period tooling for the 1-tranfermarkt-* league folders."""
@@ -0,0 +1,83 @@
+import json
+from collections import Counter
+from typing import Dict, List, NamedTuple
+
+from period_engine.aliases import AliasRegistry
+from period_engine.records import Transfer
+from period_engine.timeline import NON_CLUBS
+
+# Proposals are written next to club_list.json for review before they are applied
+PROPOSALS_FILE = 'club_aliases.proposed.json'
+
+
+class AliasProposal(NamedTuple):
+    canonical: str
+    alias: str
+    confidence: float
+    support: int
+    club_id: str
+
+
+class AliasLearner:
+    """Mine transfer histories for club spellings that belong to a known club.
+
+    Every transfer row names a club together with the Transfermarkt club ID
+    its link points to. Spellings sharing a club ID with a name the registry
+    already knows (a canonical club or one of its aliases) are the same club,
+    so they are proposed as aliases of it. Confidence is the share of that
+    ID's known spellings agreeing on the canonical club, scaled by how often
+    the new spelling was seen: n / (n + 1).
+    """
+
+    def __init__(self, registry: AliasRegistry):
+        self.registry = registry
+        self.spellings: Dict[str, Counter] = {}
+        self.histories = 0
+
+    def observe(self, transfers: List[Transfer]):
+        self.histories += 1
+        for transfer in transfers:
+            for key, club_id in ((transfer.old_key, transfer.old_id), (transfer.new_key, transfer.new_id)):
+                if club_id and key and key not in NON_CLUBS:
+                    self.spellings.setdefault(club_id, Counter())[key] += 1
+
+    def proposals(self, min_support: int = 2) -> List[AliasProposal]:
+        """New aliases seen at least `min_support` times, most confident first."""
+        proposals = []
+        for club_id, counts in self.spellings.items():
+            votes = Counter()
+            for key, seen in counts.items():
+                canonical = self.registry.known(key)
+                if canonical is not None:
+                    votes[canonical] += seen
+            if not votes:
+                continue
+            canonical, agreeing = votes.most_common(1)[0]
+            agreement = agreeing / sum(votes.values())
+            for key, seen in counts.items():
+                if seen < min_support or self.registry.known(key) is not None:
+                    continue
+                proposals.append(AliasProposal(canonical, key, round(agreement * seen / (seen + 1), 3),
+                                               seen, club_id))
+        proposals.sort(key=lambda proposal: (-proposal.confidence, proposal.canonical, proposal.alias))
+        return proposals
+
+    def summary(self, proposals: List[AliasProposal]) -> str:
+        spellings = sum(len(counts) for counts in self.spellings.values())
+        known = sum(1 for counts in self.spellings.values() for key in counts if self.registry.known(key))
+        return (f"{self.histories} histories, {spellings} spellings under {len(self.spellings)} club IDs: "
+                f"{known} already known, {len(proposals)} proposed")
+
+
+def write_proposals(path: str, proposals: List[AliasProposal]):
+    """Write proposals as {canonical: [{alias, confidence, support, club_id}]} for review."""
+    grouped: Dict[str, List[Dict]] = {}
+    for proposal in proposals:
+        grouped.setdefault(proposal.canonical, []).append({
+            'alias': proposal.alias,
+            'confidence': proposal.confidence,
+            'support': proposal.support,
+            'club_id': proposal.club_id
+        })
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(grouped, f, indent=2, ensure_ascii=False)
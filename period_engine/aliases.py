@@ -0,0 +1,110 @@
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from period_engine.clubs import ClubMatcher, build_alias_index, normalize_club_name
+
+# Source of a league's aliases: canonical club -> alias list, kept next to the league scripts
+REGISTRY_FILE = 'club_list.json'
+# Compiled lookup artifact, rebuilt only when the source file changes
+COMPILED_FILE = os.path.join('cache', 'club_aliases.compiled.json')
+COMPILED_VERSION = 1
+
+
+def source_digest(raw: bytes) -> str:
+    return hashlib.sha1(raw).hexdigest()
+
+
+class AliasRegistry:
+    """A league's club aliases, compiled into a normalized alias -> canonical index.
+
+    club_list.json is the one place aliases are edited. The compiled form
+    (the aliases plus the ready-made index, tagged with the sha1 of the
+    source) lives under cache/ and is reused as long as that digest still
+    matches, so every stage loads it instead of rebuilding the index.
+    """
+
+    def __init__(self, aliases: Dict[str, List[str]], alias_index: Optional[Dict[str, str]] = None,
+                 digest: str = ''):
+        self.aliases = aliases
+        self.alias_index = alias_index if alias_index is not None else build_alias_index(aliases)
+        self.digest = digest
+        self._canonical_names = {normalize_club_name(name): name for name in aliases}
+
+    @classmethod
+    def load(cls, league_dir: str = '.', source: str = REGISTRY_FILE,
+             compiled: str = COMPILED_FILE) -> 'AliasRegistry':
+        """Load the league's registry, recompiling it first if club_list.json changed."""
+        source_path = os.path.join(league_dir, source)
+        compiled_path = os.path.join(league_dir, compiled)
+        try:
+            with open(source_path, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            print(f"No alias registry at {source_path}; matching on club names only")
+            return cls({})
+        digest = source_digest(raw)
+
+        try:
+            with open(compiled_path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('version') == COMPILED_VERSION and stored.get('source_sha1') == digest:
+                return cls(stored['aliases'], stored['alias_index'], digest)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        registry = cls(json.loads(raw.decode('utf-8')), digest=digest)
+        registry.save(compiled_path)
+        print(f"Compiled {len(registry.alias_index)} aliases for {len(registry.aliases)} clubs from {source_path}")
+        return registry
+
+    def save(self, compiled_path: str):
+        os.makedirs(os.path.dirname(compiled_path) or '.', exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a half-written artifact
+        tmp_path = compiled_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': COMPILED_VERSION, 'source_sha1': self.digest,
+                       'aliases': self.aliases, 'alias_index': self.alias_index},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, compiled_path)
+
+    def known(self, club_name: str) -> Optional[str]:
+        """The canonical club a name is listed as (itself or an alias), or None for an unknown spelling."""
+        club_name_normalized = normalize_club_name(club_name)
+        if club_name_normalized in self.alias_index:
+            return self.alias_index[club_name_normalized]
+        return self._canonical_names.get(club_name_normalized)
+
+    def canonical(self, club_name: str) -> str:
+        club_name_normalized = normalize_club_name(club_name)
+        return self.alias_index.get(club_name_normalized, club_name_normalized)
+
+    def matcher(self, **kwargs) -> ClubMatcher:
+        """A ClubMatcher on the compiled index; kwargs go to ClubMatcher (threshold, memo_size)."""
+        return ClubMatcher(self.aliases, alias_index=self.alias_index, **kwargs)
+
+
+def add_aliases(additions: Iterable[Tuple[str, str]], league_dir: str = '.', source: str = REGISTRY_FILE) -> int:
+    """Append (canonical, alias) pairs to the league's club_list.json; returns how many were new.
+
+    Existing entries and their order are kept, so the first-listed club
+    still wins an alias claimed twice. The next AliasRegistry.load() sees
+    the changed digest and recompiles.
+    """
+    source_path = os.path.join(league_dir, source)
+    try:
+        with open(source_path, 'r', encoding='utf-8') as f:
+            aliases = json.load(f)
+    except FileNotFoundError:
+        aliases = {}
+    added = 0
+    for canonical_name, alias in additions:
+        listed = aliases.setdefault(canonical_name, [])
+        if alias not in listed:
+            listed.append(alias)
+            added += 1
+    if added:
+        with open(source_path, 'w', encoding='utf-8') as f:
+            json.dump(aliases, f, indent=2, ensure_ascii=False)
+    return added
@@ -0,0 +1,157 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Optional
+
+from playwright.async_api import async_playwright
+
+from period_engine.context_profile import LightweightProfile
+from period_engine.timing import timer
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+class RateLimiter:
+    """Spaces out request starts so at most `rate` begin per second.
+
+    Shared by every task that borrows from the same pool, so the budget
+    holds across all leagues of an orchestrated run.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+        self.waited = 0.0
+
+    async def wait(self):
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if delay > 0:
+            self.waited += delay
+            await asyncio.sleep(delay)
+
+
+class AsyncPagePool:
+    """Fixed set of pages on one Chromium for the asyncio resolvers.
+
+    At most `size` pages are in use at once, which bounds concurrency.
+    The browser starts lazily on the first borrowed page. Pages that fail or reach `recycle_after` navigations are replaced, and
+    the browser is relaunched if it disconnects. With `rate_limit` a page is
+    handed out at most that many times per second.
+    """
+
+    def __init__(self, size: int = 4, headless: bool = True, recycle_after: int = 200,
+                 user_agent: str = DEFAULT_USER_AGENT, profile: Optional[LightweightProfile] = None,
+                 rate_limit: Optional[float] = None):
+        self.size = size
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.headless = headless
+        self.recycle_after = recycle_after
+        self.user_agent = user_agent
+        self.profile = profile
+
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._uses: Dict[int, int] = {}
+        self._launch_lock = asyncio.Lock()
+        self.launches = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Start Playwright, launch the browser and open `size` pages."""
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+        if not self.is_healthy():
+            await self._launch()
+            queue = asyncio.Queue()
+            for _ in range(self.size):
+                queue.put_nowait(await self._new_page())
+            self._queue = queue
+
+    def is_healthy(self) -> bool:
+        """Return True when the browser is connected and has an open context."""
+        return self._browser is not None and self._browser.is_connected() and self._context is not None
+
+    async def _launch(self):
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"Failed to close browser: {e}")
+        with timer.phase('launch'):
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            self._context = await self._browser.new_context(user_agent=self.user_agent)
+        if self.profile is not None:
+            await self.profile.attach_async(self._context)
+        self.launches += 1
+        print(f"Browser launched (launch #{self.launches})")
+
+    async def _new_page(self):
+        page = await self._context.new_page()
+        self._uses[id(page)] = 0
+        return page
+
+    async def _replace(self, page):
+        self._uses.pop(id(page), None)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            print(f"Failed to close page: {e}")
+        async with self._launch_lock:
+            if not self.is_healthy():
+                print("Browser disconnected, relaunching")
+                await self._launch()
+        return await self._new_page()
+
+    @asynccontextmanager
+    async def page(self):
+        """Borrow a page for one navigation; waits while all pages are busy."""
+        if self._queue is None:
+            async with self._launch_lock:
+                if self._queue is None:
+                    await self.start()
+        with timer.phase('page_wait'):
+            page = await self._queue.get()
+        failed = False
+        try:
+            if self.rate_limiter is not None:
+                with timer.phase('rate_limit'):
+                    await self.rate_limiter.wait()
+            if page.is_closed() or page.context is not self._context:
+                page = await self._replace(page)
+            yield page
+        except Exception:
+            failed = True
+            raise
+        finally:
+            self._uses[id(page)] = self._uses.get(id(page), 0) + 1
+            if failed or self._uses[id(page)] >= self.recycle_after:
+                try:
+                    page = await self._replace(page)
+                except Exception as e:
+                    print(f"Failed to replace page: {e}")
+            self._queue.put_nowait(page)
+
+    async def close(self):
+        """Close the browser and stop Playwright."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                print(f"Failed to close browser: {e}")
+            self._browser = None
+            self._context = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
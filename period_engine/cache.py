@@ -0,0 +1,95 @@
+import json
+import os
+import re
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from period_engine.records import Transfer, transfers_from_json
+
+PLAYER_ID_PATTERN = re.compile(r'/spieler/(\d+)')
+CLUB_ID_PATTERN = re.compile(r'/verein/(\d+)')
+
+
+def extract_player_id(profile_url: str) -> Optional[str]:
+    """Return the Transfermarkt player ID from a /spieler/<id> URL."""
+    match = PLAYER_ID_PATTERN.search(str(profile_url))
+    return match.group(1) if match else None
+
+
+def extract_club_id(club_url: Optional[str]) -> Optional[str]:
+    """Return the Transfermarkt club ID from a /verein/<id> link, or None."""
+    match = CLUB_ID_PATTERN.search(club_url) if club_url else None
+    return match.group(1) if match else None
+
+
+class TransferCache:
+    """Parsed transfer histories on disk, one JSON file per player ID.
+
+    Entries older than `ttl_days` are treated as missing, and
+    `force_refresh` ignores every entry written before this cache was
+    opened, so a history refetched earlier in the same run is still reused.
+    Transfers are stored as compact [season, date, old_club, new_club] rows,
+    followed by [old_id, new_id] when the club IDs are known.
+    """
+
+    def __init__(self, cache_dir: str = os.path.join('cache', 'transfers'), ttl_days: float = 30,
+                 force_refresh: bool = False):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.force_refresh = force_refresh
+        self.refresh_before = time.time() if force_refresh else 0.0
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, player_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{player_id}.json")
+
+    def get(self, profile_url: str) -> Optional[List[Transfer]]:
+        """Return the cached transfers for this player, or None if absent or stale."""
+        player_id = extract_player_id(profile_url)
+        if player_id is None:
+            self.misses += 1
+            return None
+        try:
+            with open(self._path(player_id), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        fetched_at = entry.get('fetched_at', 0)
+        if fetched_at < self.refresh_before or time.time() - fetched_at > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return transfers_from_json(entry['transfers'])
+
+    def put(self, profile_url: str, transfers: Optional[List[Transfer]]):
+        """Store a freshly fetched history; an empty one is cached too, a failed fetch (None) is not."""
+        player_id = extract_player_id(profile_url)
+        if player_id is None or transfers is None:
+            return
+        entry = {
+            'player_id': player_id,
+            'profile_url': profile_url,
+            'fetched_at': time.time(),
+            'transfers': [transfer.to_row() for transfer in transfers]
+        }
+        # Write-then-rename so an interrupted run never leaves a truncated entry; the temp name is
+        # per process since league scripts running side by side share this cache
+        tmp_path = f"{self._path(player_id)}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self._path(player_id))
+
+    def histories(self) -> Iterator[Tuple[str, List[Transfer]]]:
+        """Every readable cached history as (profile_url, transfers), stale ones included."""
+        for filename in sorted(os.listdir(self.cache_dir)):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.cache_dir, filename), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                yield entry['profile_url'], transfers_from_json(entry['transfers'])
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
@@ -0,0 +1,138 @@
+import os
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+# Install fuzzywuzzy jika belum ada
+try:
+    from fuzzywuzzy import fuzz
+except ImportError:
+    print("Installing fuzzywuzzy...")
+    os.system("pip install fuzzywuzzy python-Levenshtein")
+    from fuzzywuzzy import fuzz
+
+
+def normalize_club_name(club_name: str) -> str:
+    return club_name.lower().strip()
+
+
+def build_alias_index(club_aliases: Dict[str, List[str]]) -> Dict[str, str]:
+    """Map every normalized alias to its canonical club; the first listed club wins."""
+    alias_index = {}
+    for canonical_name, aliases in club_aliases.items():
+        for alias in aliases:
+            alias_index.setdefault(normalize_club_name(alias), canonical_name)
+    return alias_index
+
+
+def char_ngrams(text: str, n: int = 3) -> Set[str]:
+    """Character n-grams of a normalized name, padded so short names still get some."""
+    padded = f" {text} "
+    if len(padded) < n:
+        return {padded}
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+class BatchClubMatcher:
+    """Resolve many club strings against a league's target clubs in one pass.
+
+    Targets are indexed by character n-grams, so a club string is only
+    scored with fuzz.ratio against targets it shares at least `min_shared`
+    n-grams with. Alias matches through the league's index never need a
+    score at all.
+    """
+
+    def __init__(self, targets: Iterable[str], alias_index: Dict[str, str], threshold: int = 80,
+                 n: int = 3, min_shared: int = 2):
+        self.alias_index = alias_index
+        self.threshold = threshold
+        self.n = n
+        self.min_shared = min_shared
+        self.targets = sorted({normalize_club_name(target) for target in targets})
+        self._by_canonical: Dict[str, Set[str]] = {}
+        self._by_gram: Dict[str, Set[str]] = {}
+        for target in self.targets:
+            self._by_canonical.setdefault(self._canonical(target), set()).add(target)
+            for gram in char_ngrams(target, n):
+                self._by_gram.setdefault(gram, set()).add(target)
+        self.scored = 0
+
+    def _canonical(self, normalized: str) -> str:
+        return self.alias_index.get(normalized, normalized)
+
+    def candidates(self, normalized: str) -> Set[str]:
+        """Targets sharing enough n-grams with `normalized` to be worth scoring."""
+        shared: Dict[str, int] = {}
+        for gram in char_ngrams(normalized, self.n):
+            for target in self._by_gram.get(gram, ()):
+                shared[target] = shared.get(target, 0) + 1
+        return {target for target, count in shared.items() if count >= self.min_shared}
+
+    def resolve(self, clubs: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+        """Map every distinct normalized club string to the targets it matches."""
+        table = {}
+        for normalized in {normalize_club_name(club) for club in clubs}:
+            matched = set(self._by_canonical.get(self._canonical(normalized), ()))
+            for target in self.candidates(normalized) - matched:
+                self.scored += 1
+                if fuzz.ratio(normalized, target) >= self.threshold:
+                    matched.add(target)
+            table[normalized] = frozenset(matched)
+        return table
+
+
+class ClubMatcher:
+    """Club-name matching for one league, built once per run.
+
+    Alias lookups go through a precompiled alias -> canonical index, and
+    the result of every (club1, club2) comparison is kept in a bounded memo,
+    so repeated transfer rows never reach fuzz.ratio again.
+    """
+
+    def __init__(self, club_aliases: Dict[str, List[str]], threshold: int = 80, memo_size: int = 65536,
+                 alias_index: Optional[Dict[str, str]] = None):
+        self.threshold = threshold
+        # A prebuilt index (e.g. from an AliasRegistry) skips rebuilding it from club_aliases
+        self.alias_index = alias_index if alias_index is not None else build_alias_index(club_aliases)
+        self._match = lru_cache(maxsize=memo_size)(self._compute_match)
+        # Per club string: the targets it was resolved against, and those among them it matches
+        self.resolved_against: Dict[str, Set[str]] = {}
+        self.resolved: Dict[str, Set[str]] = {}
+
+    def resolve_batch(self, clubs: Iterable[str], targets: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+        """Resolve every club string against `targets` up front with a BatchClubMatcher.
+
+        The resulting table answers is_match(club, target) for those pairs
+        without touching the memo or fuzz.ratio. Results of earlier calls
+        are kept, so each pair is answered against the targets it was
+        actually resolved with.
+        """
+        clubs = list(clubs)
+        batch = BatchClubMatcher(targets, self.alias_index, self.threshold)
+        table = batch.resolve(clubs)
+        for club, matched in table.items():
+            self.resolved_against.setdefault(club, set()).update(batch.targets)
+            self.resolved.setdefault(club, set()).update(matched)
+        print(f"Resolved {len(table)} club names against {len(batch.targets)} clubs "
+              f"with {batch.scored} fuzzy comparisons instead of {len(table) * len(batch.targets)}")
+        return table
+
+    def canonical(self, club_name: str) -> str:
+        club_name_normalized = normalize_club_name(club_name)
+        return self.alias_index.get(club_name_normalized, club_name_normalized)
+
+    def _compute_match(self, club1: str, club2: str) -> bool:
+        if self.canonical(club1) == self.canonical(club2):
+            return True
+        similarity = fuzz.ratio(normalize_club_name(club1), normalize_club_name(club2))
+        return similarity >= self.threshold
+
+    def is_match(self, club1: str, club2: str) -> bool:
+        club = normalize_club_name(club1)
+        target = normalize_club_name(club2)
+        if target in self.resolved_against.get(club, ()):
+            return target in self.resolved[club]
+        return self._match(club1, club2)
+
+    def memo_info(self):
+        """lru_cache statistics of the pair memo (hits, misses, maxsize, currsize)."""
+        return self._match.cache_info()
@@ -0,0 +1,155 @@
+import time
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlsplit
+
+# Resource types the transfer fetcher never needs
+DEFAULT_BLOCKED_TYPES = ('image', 'media', 'font', 'stylesheet', 'texttrack', 'eventsource', 'manifest')
+
+# Ad, consent and analytics hosts seen on Transfermarkt pages
+DEFAULT_BLOCKED_DOMAINS = (
+    'doubleclick.net', 'googlesyndication.com', 'googletagmanager.com', 'google-analytics.com',
+    'googletagservices.com', 'adservice.google.com', 'amazon-adsystem.com', 'criteo.com', 'criteo.net',
+    'taboola.com', 'outbrain.com', 'hotjar.com', 'facebook.net', 'scorecardresearch.com',
+    'quantserve.com', 'consensu.org', 'sourcepoint.com', 'privacy-mgmt.com', 'adnxs.com',
+    'rubiconproject.com', 'pubmatic.com', 'casalemedia.com', 'yieldlove.com', 'id5-sync.com',
+)
+
+# Hosts that serve the page itself and the scripts that render the transfer grid
+DEFAULT_FIRST_PARTY = ('transfermarkt', 'tmssl.akamaized.net')
+
+
+class PageLoadStats:
+    """What one navigation loaded and blocked."""
+
+    __slots__ = ('url', 'started', 'elapsed', 'bytes_loaded', 'blockable_bytes', 'blocked', 'calibration')
+
+    def __init__(self, url: str, calibration: bool):
+        self.url = url
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.bytes_loaded = 0
+        self.blockable_bytes = 0
+        self.blocked: Dict[str, int] = {}
+        self.calibration = calibration
+
+
+class LightweightProfile:
+    """Route rules for the transfer fetcher's browser context, plus savings stats.
+
+    Non-essential resource types and third-party hosts are aborted. The first
+    `calibration_pages` navigations load everything and record what would
+    have been blocked. That baseline turns the later pages' numbers into
+    bytes and seconds saved per page. Byte counts come from Content-Length.
+    """
+
+    def __init__(self, blocked_types: Sequence[str] = DEFAULT_BLOCKED_TYPES,
+                 blocked_domains: Sequence[str] = DEFAULT_BLOCKED_DOMAINS,
+                 first_party: Sequence[str] = DEFAULT_FIRST_PARTY,
+                 block_third_party: bool = True, calibration_pages: int = 1, verbose: bool = True):
+        self.blocked_types = set(blocked_types)
+        self.blocked_domains = tuple(blocked_domains)
+        self.first_party = tuple(first_party)
+        self.block_third_party = block_third_party
+        self.calibration_pages = calibration_pages
+        self.verbose = verbose
+
+        self._active: Dict[int, PageLoadStats] = {}
+        self.baseline: List[PageLoadStats] = []
+        self.pages: List[PageLoadStats] = []
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        """Return True when a request is not needed to read the transfer history."""
+        if resource_type == 'document':
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        host = urlsplit(url).hostname or ''
+        if any(host == domain or host.endswith('.' + domain) for domain in self.blocked_domains):
+            return True
+        if self.block_third_party and not any(marker in host for marker in self.first_party):
+            return True
+        return False
+
+    async def attach_async(self, context):
+        """Install the route rules and byte counter on an async BrowserContext."""
+        await context.route("**/*", self.handle_route_async)
+        context.on("response", self.handle_response)
+
+    def _stats_for(self, request) -> Optional[PageLoadStats]:
+        try:
+            return self._active.get(id(request.frame.page))
+        except Exception:
+            return None
+
+    def _decide(self, request) -> bool:
+        if not self.should_block(request.url, request.resource_type):
+            return False
+        stats = self._stats_for(request)
+        if stats is not None and stats.calibration:
+            return False
+        if stats is not None:
+            stats.blocked[request.resource_type] = stats.blocked.get(request.resource_type, 0) + 1
+        return True
+
+    async def handle_route_async(self, route):
+        if self._decide(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def handle_response(self, response):
+        stats = self._stats_for(response.request)
+        if stats is None:
+            return
+        try:
+            size = int(response.headers.get('content-length', 0))
+        except ValueError:
+            size = 0
+        stats.bytes_loaded += size
+        if stats.calibration and self.should_block(response.url, response.request.resource_type):
+            stats.blockable_bytes += size
+
+    def begin(self, page, url: str):
+        """Start measuring a navigation on `page`."""
+        calibration = len(self.baseline) + sum(s.calibration for s in self._active.values()) < self.calibration_pages
+        self._active[id(page)] = PageLoadStats(url, calibration)
+
+    def end(self, page) -> Optional[PageLoadStats]:
+        """Finish measuring `page` and print its savings line."""
+        stats = self._active.pop(id(page), None)
+        if stats is None or (stats.bytes_loaded == 0 and not stats.blocked):
+            # Nothing went over the page's network stack (e.g. the api fetch mode)
+            return None
+        stats.elapsed = time.perf_counter() - stats.started
+        if stats.calibration:
+            self.baseline.append(stats)
+            if self.verbose:
+                print(f"[profile] calibration {stats.url}: {stats.bytes_loaded / 1024:.0f} KB in {stats.elapsed:.2f}s, "
+                      f"{stats.blockable_bytes / 1024:.0f} KB blockable")
+        else:
+            self.pages.append(stats)
+            if self.verbose:
+                saved_bytes, saved_seconds = self.saved(stats)
+                print(f"[profile] {stats.url}: {stats.bytes_loaded / 1024:.0f} KB in {stats.elapsed:.2f}s, "
+                      f"{sum(stats.blocked.values())} requests blocked, "
+                      f"~{saved_bytes / 1024:.0f} KB and {saved_seconds:.2f}s saved")
+        return stats
+
+    def saved(self, stats: PageLoadStats):
+        """Estimate (bytes, seconds) saved on one page against the calibration baseline."""
+        if not self.baseline:
+            return 0, 0.0
+        baseline_bytes = sum(s.bytes_loaded for s in self.baseline) / len(self.baseline)
+        baseline_seconds = sum(s.elapsed for s in self.baseline) / len(self.baseline)
+        return max(baseline_bytes - stats.bytes_loaded, 0), max(baseline_seconds - stats.elapsed, 0.0)
+
+    def summary(self) -> str:
+        """One line with the average savings over every measured page."""
+        if not self.pages:
+            return "[profile] no blocked page loads measured"
+        savings = [self.saved(stats) for stats in self.pages]
+        blocked = sum(sum(stats.blocked.values()) for stats in self.pages)
+        avg_bytes = sum(b for b, _ in savings) / len(savings)
+        avg_seconds = sum(s for _, s in savings) / len(savings)
+        return (f"[profile] {len(self.pages)} pages, {blocked} requests blocked, "
+                f"~{avg_bytes / 1024:.0f} KB and {avg_seconds:.2f}s saved per page")
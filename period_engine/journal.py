@@ -0,0 +1,73 @@
+import json
+import os
+from typing import Dict, Optional, Tuple
+
+
+def journal_key(profile_url: str, club: str) -> Tuple[str, str]:
+    return str(profile_url), str(club)
+
+
+class ResultJournal:
+    """Append-only JSON-lines log of finished (player, club) results.
+
+    Every record is flushed and synced before the next player starts, so a
+    crash or Ctrl-C loses at most the player in flight. With `resume` the
+    existing log is read back and those entries are skipped; otherwise it is
+    truncated and the run starts from scratch. Only the entries read back are
+    kept in memory; new results go straight to disk.
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.resume = resume
+        self.entries: Dict[Tuple[str, str], Dict[str, str]] = {}
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        if resume:
+            self._load()
+            print(f"Resuming: {len(self.entries)} results already in {self.path}")
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        if resume and self._file.tell() > 0:
+            # Start on a fresh line even if the previous run died mid-write
+            self._file.write("\n")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Last line cut off by the crash we are resuming from
+                    continue
+                if isinstance(record, dict):
+                    # Older journals wrote one object per record
+                    profile_url, club, row = record['profile_url'], record['club'], record['row']
+                else:
+                    profile_url, name, club, periods = record
+                    row = {'name': name, 'club': club, 'periods': periods}
+                self.entries[journal_key(profile_url, club)] = row
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self.entries
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, str]]:
+        return self.entries.get(key)
+
+    def record(self, profile_url: str, club: str, row: Dict[str, str]):
+        """Append one result and push it to disk."""
+        # One compact [profile_url, name, club, periods] array per line
+        record = [str(profile_url), row['name'], row['club'], row['periods']]
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
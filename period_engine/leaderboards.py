@@ -0,0 +1,73 @@
+import os
+import re
+from glob import glob
+from typing import Dict, List, Optional
+
+# Leaderboards written per club by _dataset_to_input.py, as <club>_<board>.csv
+LEADERBOARDS = ('top_goals', 'top_assists')
+
+
+def club_stem(path: str) -> Optional[str]:
+    """Return the <club> part of a <club>_<board>.csv path, or None for other files."""
+    name = os.path.splitext(os.path.basename(path))[0]
+    for board in LEADERBOARDS:
+        if name.endswith('_' + board):
+            return name[:-len(board) - 1]
+    return None
+
+
+def sanitize_stem(stem: str) -> str:
+    """A club's file stem in the form _dataset_to_input.py writes it (sanitize_club_name), e.g. cf_montréal -> cf_montr_al.
+
+    Leading and trailing underscores are dropped, since raw/ and input/
+    disagree on them for club names ending in punctuation or a space.
+    """
+    return re.sub(r'[^a-zA-Z0-9_]', '_', stem.lower()).strip('_')
+
+
+def club_leaderboards(stem: str, raw_folder: str = 'raw', input_folder: str = 'input') -> List[str]:
+    """Every leaderboard file of one club, taken from raw/ when present there, else from input/.
+
+    input/ names are sanitized by _dataset_to_input.py, so a raw stem with
+    accents or dots is looked up there under its sanitized form as well.
+    """
+    paths = []
+    for board in LEADERBOARDS:
+        for folder in (raw_folder, input_folder):
+            path = os.path.join(folder, f"{stem}_{board}.csv")
+            if os.path.exists(path):
+                paths.append(path)
+                break
+        else:
+            sanitized = sanitize_stem(stem)
+            paths.extend(path for path in sorted(glob(os.path.join(input_folder, f"*_{board}.csv")))
+                         if sanitize_stem(club_stem(path)) == sanitized)
+    return paths
+
+
+def leaderboard_files(raw_folder: str = 'raw', input_folder: str = 'input') -> List[str]:
+    """The CSVs in raw/ plus the other leaderboards of every club found there, club by club.
+
+    A club's leaderboards are listed next to each other, so its period file
+    can be finished as soon as they are done instead of at the end of the run.
+    """
+    files = []
+    seen = set()
+    for path in sorted(glob(os.path.join(raw_folder, '*.csv'))):
+        stem = club_stem(path)
+        club_files = [path] if stem is None else [path] + club_leaderboards(stem, raw_folder, input_folder)
+        for club_file in club_files:
+            if club_file not in seen:
+                files.append(club_file)
+                seen.add(club_file)
+    return files
+
+
+def unique_players(players: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Drop repeated (profile_url, club) pairs, keeping the first occurrence."""
+    unique = {}
+    for player in players:
+        unique.setdefault((str(player['profile_url']), str(player['club'])), player)
+    if len(unique) < len(players):
+        print(f"{len(players)} leaderboard entries, {len(unique)} unique players")
+    return list(unique.values())
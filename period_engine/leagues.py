@@ -0,0 +1,192 @@
+import os
+import random
+from glob import glob
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from period_engine import periods
+from period_engine.aliases import AliasRegistry
+from period_engine.browser_pool import AsyncPagePool
+from period_engine.cache import TransferCache
+from period_engine.journal import ResultJournal
+from period_engine.leaderboards import club_stem, leaderboard_files, sanitize_stem, unique_players
+from period_engine.player_registry import PlayerRegistry
+from period_engine.resolver import resolve_with_pool
+from period_engine.timeline import CareerIndex
+from period_engine.verify import DriftReport, sample_rows
+from period_engine.writer import PeriodCsvWriter, PeriodTextWriter
+
+LEAGUE_PREFIX = '1-tranfermarkt-'
+
+# Script each job type replaces, in order of preference
+JOB_SCRIPTS = {
+    'get': ('_get_period__.py', '_get_period.py'),
+    'check': ('_check_period.py',),
+}
+
+
+def discover_leagues(root: str, job: str = 'get') -> List[str]:
+    """League folders under `root` that have a raw/ folder and a script for `job`."""
+    leagues = []
+    for folder in sorted(glob(os.path.join(root, LEAGUE_PREFIX + '*'))):
+        if os.path.isdir(os.path.join(folder, 'raw')) and league_script(folder, job) is not None:
+            leagues.append(folder)
+    return leagues
+
+
+def league_script(league_dir: str, job: str) -> Optional[str]:
+    for name in JOB_SCRIPTS[job]:
+        path = os.path.join(league_dir, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def read_leaderboard(path: str) -> pd.DataFrame:
+    """A leaderboard CSV, read as UTF-8 or, for files saved from Excel, as latin-1."""
+    try:
+        return pd.read_csv(path, encoding='utf-8')
+    except UnicodeDecodeError:
+        return pd.read_csv(path, encoding='latin-1')
+
+
+class LeagueJob:
+    """One league's _get_period (job='get') or _check_period (job='check') run.
+
+    The league scripts and _run_all_periods.py both run this job: every path
+    is rooted at `league_dir` and pages come from a pool passed in by the
+    caller, so one process can run all leagues on a single browser. With a
+    `player_registry`, histories come from its cache shared by all leagues,
+    so a player several leagues list is fetched once.
+
+    A check compares the stored periods with the live site, so by default it
+    skips the career index and refetches every sampled player (the fresh
+    histories still refresh the transfer cache). `check_cached=True` lets it
+    answer from the index and cache like a get.
+    """
+
+    def __init__(self, league_dir: str, job: str = 'get', fetch_mode: str = 'api',
+                 cache_ttl_days: float = 30, force_refresh: bool = False, resume: bool = False,
+                 sample_size: int = 1, sample_strategy: str = 'first', seed: Optional[int] = None,
+                 drift_threshold: float = 0.1, player_registry: Optional[PlayerRegistry] = None,
+                 career_index_path: Optional[str] = None, check_cached: bool = False):
+        self.league_dir = league_dir
+        self.name = os.path.basename(os.path.normpath(league_dir))
+        self.job = job
+        self.fetch_mode = fetch_mode
+        self.sample_size = sample_size
+        self.sample_strategy = sample_strategy
+        self.rng = random.Random(seed)
+        self.drift_threshold = drift_threshold
+
+        alias_registry = AliasRegistry.load(league_dir)
+        self.matcher = alias_registry.matcher()
+        cache_dir = os.path.join(league_dir, 'cache')
+        self.player_registry = player_registry
+        if player_registry is not None:
+            player_registry.adopt(os.path.join(cache_dir, 'transfers'))
+            self.cache = player_registry.cache
+        else:
+            self.cache = TransferCache(os.path.join(cache_dir, 'transfers'), cache_ttl_days, force_refresh)
+        self.refetch = job == 'check' and not check_cached
+        self.timeline: Optional[CareerIndex] = None
+        if self.refetch:
+            self.cache = TransferCache(self.cache.cache_dir, cache_ttl_days, force_refresh=True)
+        else:
+            self.timeline = CareerIndex(self.matcher,
+                                        career_index_path or os.path.join(cache_dir, 'career_index.json'),
+                                        cache_ttl_days, force_refresh, alias_registry.digest)
+        self.journal_path = os.path.join(cache_dir, f"{job}_period_journal.jsonl")
+        self.resume = resume
+        self.output_folder = os.path.join(league_dir, 'period')
+        self._players: Optional[List[Dict[str, str]]] = None
+
+    def period_fn(self, transfers, target_club):
+        return periods.get_period_in_club(transfers, target_club, self.matcher)
+
+    def players(self) -> List[Dict[str, str]]:
+        """The players this job resolves, read from the league's leaderboards once."""
+        if self._players is not None:
+            return self._players
+        paths = leaderboard_files(os.path.join(self.league_dir, 'raw'), os.path.join(self.league_dir, 'input'))
+        if self.job == 'check':
+            frames = [sample_rows(df, self.sample_size, self.sample_strategy, self.rng)
+                      for df in self.club_leaderboards(paths)]
+        else:
+            frames = [read_leaderboard(path) for path in paths]
+        players = []
+        for df in frames:
+            for _, row in df.iterrows():
+                players.append({
+                    'name': row['name'],
+                    'club': row['club'],
+                    'profile_url': row['profile_url'],
+                    'expected': row.get('period')
+                })
+        self._players = unique_players(players)
+        return self._players
+
+    @staticmethod
+    def club_leaderboards(paths: List[str]) -> List[pd.DataFrame]:
+        """One frame per club with all of its leaderboards, so a check samples clubs rather than files."""
+        by_club: Dict[str, List[pd.DataFrame]] = {}
+        for path in paths:
+            by_club.setdefault(sanitize_stem(club_stem(path) or path), []).append(read_leaderboard(path))
+        return [pd.concat(frames, ignore_index=True).drop_duplicates('profile_url') for frames in by_club.values()]
+
+    async def run(self, page_pool: AsyncPagePool) -> str:
+        """Resolve the league on `page_pool` and write its period/ outputs; returns a summary line."""
+        players = self.players()
+        if not players:
+            return f"{self.name}: no players found"
+        if self.player_registry is not None:
+            self.player_registry.register(self.name, players)
+        os.makedirs(self.output_folder, exist_ok=True)
+        journal = ResultJournal(self.journal_path, resume=self.resume)
+        try:
+            if self.job == 'get':
+                summary = await self._run_get(players, page_pool, journal)
+            else:
+                summary = await self._run_check(players, page_pool, journal)
+        finally:
+            journal.close()
+            if self.timeline is not None:
+                self.timeline.save()
+        parts = [summary]
+        if self.player_registry is None or self.refetch:
+            parts.append(f"cache {self.cache.hits} hits, {self.cache.misses} misses")
+        if self.timeline is not None:
+            parts.append(self.timeline.summary())
+        return f"{self.name}: " + "; ".join(parts)
+
+    async def _run_get(self, players, page_pool, journal) -> str:
+        writer = PeriodCsvWriter(self.output_folder, players)
+        await resolve_with_pool(players, page_pool, self.period_fn, no_data="", cache=self.cache,
+                                fetch_mode=self.fetch_mode, matcher=self.matcher, timeline=self.timeline,
+                                journal=journal, on_row=writer.write, registry=self.player_registry)
+        writer.close()
+        return f"{len(writer.finished)} club files written"
+
+    async def _run_check(self, players, page_pool, journal) -> str:
+        results_writer = PeriodTextWriter(os.path.join(self.output_folder, "all_results.txt"))
+        drift_report = DriftReport(threshold=self.drift_threshold)
+
+        def record_result(player, result):
+            if result is None:
+                drift_report.add_unresolved(player['club'])
+                return
+            results_writer.write(result)
+            if not drift_report.add(player['club'], player['name'], player['expected'], result['periods']):
+                print(f"Drift for {player['name']} in {player['club']}: "
+                      f"stored {player['expected']}, now {result['periods']}")
+
+        try:
+            await resolve_with_pool(players, page_pool, self.period_fn, no_data="NO DATA", cache=self.cache,
+                                    fetch_mode=self.fetch_mode, matcher=self.matcher, timeline=self.timeline,
+                                    journal=journal, on_row=record_result,
+                                    registry=None if self.refetch else self.player_registry)
+        finally:
+            results_writer.close(no_data_first=True)
+        drift_report.write(os.path.join(self.output_folder, "drift_report.txt"))
+        return drift_report.summary()
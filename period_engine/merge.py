@@ -0,0 +1,168 @@
+import json
+import os
+from glob import glob
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from period_engine.cache import PLAYER_ID_PATTERN
+from period_engine.leaderboards import club_stem
+
+PERIOD_COLUMN = 'period'
+KEY_COLUMNS = ['player_id', 'club_key']
+
+
+def read_csv_text(path: str) -> pd.DataFrame:
+    """Read a CSV with every cell as text, so writing it back changes nothing but what was set."""
+    try:
+        return pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8')
+    except UnicodeDecodeError:
+        return pd.read_csv(path, dtype=str, keep_default_na=False, encoding='latin-1')
+
+
+def player_ids(profile_urls: pd.Series) -> pd.Series:
+    """Transfermarkt player IDs of a column of profile URLs ('' where there is none)."""
+    return profile_urls.astype(str).str.extract(PLAYER_ID_PATTERN.pattern, expand=False).fillna('')
+
+
+def club_keys(clubs: pd.Series) -> pd.Series:
+    # Same as normalize_club_name, on a whole column
+    return clubs.astype(str).str.lower().str.strip()
+
+
+def load_periods(period_folder: str) -> pd.DataFrame:
+    """Every period/*.csv of a league in one frame keyed by player ID and club.
+
+    Files written before period rows carried a profile_url get an empty
+    player_id; they are matched by name instead.
+    """
+    frames = [read_csv_text(path) for path in sorted(glob(os.path.join(period_folder, '*.csv')))]
+    if not frames:
+        return pd.DataFrame(columns=KEY_COLUMNS + ['name', 'periods'])
+    periods = pd.concat(frames, ignore_index=True)
+    if 'profile_url' not in periods.columns:
+        periods['profile_url'] = ''
+    periods['profile_url'] = periods['profile_url'].fillna('')
+    periods['player_id'] = player_ids(periods['profile_url'])
+    periods['club_key'] = club_keys(periods['club'])
+    return periods[KEY_COLUMNS + ['name', 'periods']]
+
+
+def leaderboard_paths(folders: List[str]) -> List[str]:
+    return [path for folder in folders for path in sorted(glob(os.path.join(folder, '*.csv')))
+            if club_stem(path) is not None]
+
+
+def unambiguous_by_name(keys: pd.DataFrame, periods: pd.DataFrame) -> pd.DataFrame:
+    """The period rows without a player ID whose (name, club) names exactly one player.
+
+    A pair is ambiguous when the period files hold different periods for it
+    or `keys` lists several player IDs under it; such pairs are logged and
+    left unmatched rather than given another player's period.
+    """
+    by_name = periods[periods['player_id'] == ''].drop_duplicates(['name', 'club_key', 'periods'])
+    if by_name.empty:
+        return by_name
+    name_keys = ['name', 'club_key']
+    period_counts = by_name.groupby(name_keys)['periods'].size()
+    id_counts = keys[keys['player_id'] != ''].drop_duplicates(KEY_COLUMNS + ['name']).groupby(name_keys).size()
+    shared = (period_counts > 1).values | period_counts.index.isin(id_counts[id_counts > 1].index)
+    ambiguous = period_counts.index[shared]
+    for name, club_key in ambiguous:
+        print(f"{name} at {club_key}: several players share this name, period left unmatched")
+    return by_name[~pd.MultiIndex.from_frame(by_name[name_keys]).isin(ambiguous)]
+
+
+def match_periods(keys: pd.DataFrame, periods: pd.DataFrame) -> pd.Series:
+    """The period for every row of `keys` (player_id, club_key, name), NaN where none is known."""
+    by_id = periods[periods['player_id'] != ''].drop_duplicates(KEY_COLUMNS, keep='last')
+    matched = keys.merge(by_id[KEY_COLUMNS + ['periods']], on=KEY_COLUMNS, how='left')['periods']
+    by_name = unambiguous_by_name(keys, periods)
+    if not by_name.empty:
+        fallback = keys.merge(by_name[['name', 'club_key', 'periods']], on=['name', 'club_key'], how='left')
+        matched = matched.fillna(fallback['periods'])
+    return matched
+
+
+def write_if_changed(path: str, text: str) -> bool:
+    try:
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            if f.read() == text:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def merge_periods(period_folder: str = 'period', leaderboard_folders: Optional[List[str]] = None,
+                  json_folder: Optional[str] = None) -> Dict[str, int]:
+    """Write the league's resolved periods into every leaderboard, in one join.
+
+    All period files and all leaderboards (raw/ and input/ by default) are
+    loaded once; leaderboard rows are matched on (player ID, club) and their
+    `period` column is replaced where a period is known. Rows without one
+    keep their value. Only files whose content changed are rewritten. With
+    `json_folder` the output/*.json leaderboards are patched the same way.
+    """
+    leaderboard_folders = leaderboard_folders or ['raw', 'input']
+    periods = load_periods(period_folder)
+    counts = {'periods': len(periods), 'files': 0, 'rows': 0, 'rewritten': 0, 'json_rewritten': 0}
+    if periods.empty:
+        return counts
+
+    boards = {path: read_csv_text(path) for path in leaderboard_paths(leaderboard_folders)}
+    boards = {path: df for path, df in boards.items() if {'name', 'club', 'profile_url'} <= set(df.columns)}
+    counts['files'] = len(boards)
+    if boards:
+        keys = pd.concat([
+            pd.DataFrame({'source': path, 'row': range(len(df)), 'player_id': player_ids(df['profile_url']).values,
+                          'club_key': club_keys(df['club']).values, 'name': df['name'].values})
+            for path, df in boards.items()
+        ], ignore_index=True)
+        keys['periods'] = match_periods(keys[KEY_COLUMNS + ['name']], periods).values
+        found = keys[keys['periods'].notna()]
+        counts['rows'] = len(found)
+        for path, rows in found.groupby('source', sort=False):
+            df = boards[path]
+            if PERIOD_COLUMN not in df.columns:
+                df[PERIOD_COLUMN] = ''
+            df.iloc[rows['row'].values, df.columns.get_loc(PERIOD_COLUMN)] = rows['periods'].values
+            if write_if_changed(path, df.to_csv(index=False, lineterminator=os.linesep)):
+                counts['rewritten'] += 1
+
+    if json_folder is not None:
+        counts['json_rewritten'] = patch_json_outputs(json_folder, periods)
+    return counts
+
+
+def patch_json_outputs(json_folder: str, periods: pd.DataFrame) -> int:
+    """Set `period` in the output/*.json rows the way _raw_to_output.py writes it; returns files rewritten."""
+    rewritten = 0
+    for path in sorted(glob(os.path.join(json_folder, '*.json'))):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if not isinstance(rows, list) or not rows:
+            continue
+        keys = pd.DataFrame({
+            'player_id': player_ids(pd.Series([row.get('profile_url') or '' for row in rows])),
+            'club_key': club_keys(pd.Series([row.get('club') or '' for row in rows])),
+            'name': [row.get('name') or '' for row in rows],
+        })
+        changed = False
+        for row, value in zip(rows, match_periods(keys, periods)):
+            if not isinstance(value, str):
+                continue
+            value = value.strip() or None
+            if row.get(PERIOD_COLUMN) != value:
+                row[PERIOD_COLUMN] = value
+                changed = True
+        if changed and write_if_changed(path, json.dumps(rows, ensure_ascii=False, indent=2)):
+            rewritten += 1
+    return rewritten
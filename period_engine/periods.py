@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import List
+
+from period_engine.clubs import ClubMatcher
+from period_engine.records import Period, Transfer
+
+
+def get_period_in_club(transfers: List[Transfer], target_club: str,
+                       matcher: ClubMatcher) -> List[Period]:
+    """Return the (start, end) stints a player had at `target_club`."""
+    return close_open_periods(get_period_spans(transfers, target_club, matcher))
+
+
+def close_open_periods(spans: List[Period]) -> List[Period]:
+    """End spans that are still running (end None) at the current time."""
+    now = datetime.now()
+    return [Period(start, end if end is not None else now) for start, end in spans]
+
+
+def get_period_spans(transfers: List[Transfer], target_club: str,
+                     matcher: ClubMatcher) -> List[Period]:
+    """Like get_period_in_club(), but a stint that is still running ends in None."""
+    # Each distinct club string is matched once, however often it repeats
+    matches = {}
+
+    def is_target(club: str) -> bool:
+        if club not in matches:
+            matches[club] = matcher.is_match(club, target_club)
+        return matches[club]
+
+    periods = []
+    current_start = None
+    for transfer in transfers:
+        date = transfer.when
+        if date is None:
+            continue
+        if is_target(transfer.new_club):
+            if not current_start:
+                current_start = date
+        elif is_target(transfer.old_club) and current_start:
+            periods.append(Period(current_start, date))
+            current_start = None
+    if current_start:
+        for transfer in transfers:
+            if transfer.new_key == 'retired':
+                if transfer.when:
+                    periods.append(Period(current_start, transfer.when))
+                    current_start = None
+                    break
+        if current_start:
+            periods.append(Period(current_start, None))
+    return periods
+
+
+def format_periods(periods_list, no_data: str = "NO DATA") -> str:
+    """Render [(start, end), ...] as "2005-2010, 2012-2013", or `no_data` when empty."""
+    if not periods_list:
+        return no_data
+    period_strings = [f"{start.strftime('%Y')}-{end.strftime('%Y')}" for start, end in periods_list]
+    return ", ".join(period_strings)
@@ -0,0 +1,119 @@
+import asyncio
+import json
+import os
+import shutil
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from period_engine.cache import TransferCache, extract_player_id
+from period_engine.records import Transfer
+
+# Repo root: the parent of the period_engine package, where every 1-tranfermarkt-* folder lives
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class PlayerRegistry:
+    """Every player any league references, keyed by Transfermarkt player ID.
+
+    Records which leagues and clubs reference each player, and sits in
+    front of one TransferCache shared by all leagues, so a player listed
+    by several leagues is fetched once. Within a process, leagues asking for
+    the same player at the same time wait on a single in-flight fetch.
+    """
+
+    def __init__(self, path: str, cache: TransferCache):
+        self.path = path
+        self.cache = cache
+        self.entries: Dict[str, Dict] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.joined = 0
+        self.load()
+
+    @classmethod
+    def shared(cls, root: str = REPO_ROOT, ttl_days: float = 30, force_refresh: bool = False) -> 'PlayerRegistry':
+        """The registry under <root>/cache used by every league script and the multi-league runner."""
+        cache_dir = os.path.join(root, 'cache')
+        return cls(os.path.join(cache_dir, 'player_registry.json'),
+                   TransferCache(os.path.join(cache_dir, 'transfers'), ttl_days, force_refresh))
+
+    def load(self):
+        self.entries = self._read()
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable player registry {self.path}: {e}")
+            return {}
+
+    def save(self):
+        """Write the registry back, merging in references other processes saved meanwhile."""
+        stored = self._read()
+        for player_id, entry in self.entries.items():
+            merged = stored.setdefault(player_id, {'profile_url': entry['profile_url'], 'name': entry['name'],
+                                                   'refs': []})
+            for ref in entry['refs']:
+                if ref not in merged['refs']:
+                    merged['refs'].append(ref)
+        self.entries = stored
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # Write-then-rename so an interrupted run never leaves a truncated registry
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def register(self, league: str, players: List[Dict[str, str]]):
+        """Record that `league` references each of `players` at their club."""
+        for player in players:
+            player_id = extract_player_id(player['profile_url'])
+            if player_id is None:
+                continue
+            entry = self.entries.setdefault(player_id, {'profile_url': player['profile_url'],
+                                                        'name': player['name'], 'refs': []})
+            ref = [league, player['club']]
+            if ref not in entry['refs']:
+                entry['refs'].append(ref)
+
+    def leagues(self, player_id: str) -> List[str]:
+        entry = self.entries.get(player_id)
+        return sorted({league for league, _ in entry['refs']}) if entry else []
+
+    def adopt(self, cache_dir: str) -> int:
+        """Copy a league's own cached histories into the shared cache where it has none; returns the count."""
+        if not os.path.isdir(cache_dir) or os.path.abspath(cache_dir) == os.path.abspath(self.cache.cache_dir):
+            return 0
+        adopted = 0
+        for filename in os.listdir(cache_dir):
+            target = os.path.join(self.cache.cache_dir, filename)
+            if filename.endswith('.json') and not os.path.exists(target):
+                shutil.copy2(os.path.join(cache_dir, filename), target)
+                adopted += 1
+        return adopted
+
+    async def fetch(self, profile_url: str,
+                    fetch: Callable[[], Awaitable[Optional[List[Transfer]]]]) -> Optional[List[Transfer]]:
+        """Run `fetch()` for this player unless a fetch for the same player ID is already running.
+
+        `fetch` is expected to go through self.cache, which answers every
+        request after the first one has stored the history.
+        """
+        key = extract_player_id(profile_url) or profile_url
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            # Once stored, later requests are answered by the cache instead of holding the result here
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.joined += 1
+        return await asyncio.shield(task)
+
+    def summary(self) -> str:
+        references = sum(len(entry['refs']) for entry in self.entries.values())
+        shared = sum(1 for player_id in self.entries if len(self.leagues(player_id)) > 1)
+        return (f"Player registry: {len(self.entries)} players, {references} league/club references, "
+                f"{shared} in more than one league; transfer cache {self.cache.hits} hits, "
+                f"{self.cache.misses} misses, {self.joined} joined a running fetch")
@@ -0,0 +1,92 @@
+import sys
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Union
+
+from period_engine.clubs import normalize_club_name
+
+
+def parse_date(date_str: str) -> Optional[datetime]:
+    try:
+        return datetime.strptime(date_str, '%b %d, %Y')
+    except ValueError:
+        try:
+            return datetime.strptime(date_str, '%d %b %Y')
+        except ValueError:
+            return None
+
+
+class Transfer:
+    """One row of a transfer history.
+
+    The date is parsed once here and kept as `when` (None when unparseable).
+    `old_key`/`new_key` are the normalized club names the matcher works on,
+    and `old_id`/`new_id` the Transfermarkt club IDs behind the club links
+    (None when the source had no link).
+    Club strings are interned, since the same few clubs repeat across
+    thousands of histories. Item access (transfer['date']) is kept for
+    code written against the old dict rows.
+    """
+
+    __slots__ = ('season', 'date', 'old_club', 'new_club', 'when', 'old_key', 'new_key', 'old_id', 'new_id')
+
+    FIELDS = ('season', 'date', 'old_club', 'new_club')
+
+    def __init__(self, season: str, date: str, old_club: str, new_club: str,
+                 old_id: Optional[str] = None, new_id: Optional[str] = None):
+        self.season = season
+        self.date = date
+        self.old_club = sys.intern(old_club)
+        self.new_club = sys.intern(new_club)
+        self.when = parse_date(date)
+        self.old_key = sys.intern(normalize_club_name(old_club))
+        self.new_key = sys.intern(normalize_club_name(new_club))
+        self.old_id = old_id
+        self.new_id = new_id
+
+    def __getitem__(self, field: str) -> str:
+        if field not in self.FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Transfer) and self.to_row() == other.to_row()
+
+    def __repr__(self) -> str:
+        return f"Transfer({self.season!r}, {self.date!r}, {self.old_club!r}, {self.new_club!r})"
+
+    def sort_key(self) -> datetime:
+        return self.when or datetime.min
+
+    def to_row(self) -> List[Optional[str]]:
+        """Compact form for the cache: [season, date, old_club, new_club], plus [old_id, new_id] when known."""
+        row = [self.season, self.date, self.old_club, self.new_club]
+        if self.old_id is not None or self.new_id is not None:
+            row += [self.old_id, self.new_id]
+        return row
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return dict(zip(self.FIELDS, self.to_row()))
+
+    @classmethod
+    def from_json(cls, item: Union[List[str], Dict[str, str]]) -> 'Transfer':
+        """Build a Transfer from a compact row or an old-style dict entry."""
+        if isinstance(item, dict):
+            return cls(item['season'], item['date'], item['old_club'], item['new_club'],
+                       item.get('old_id'), item.get('new_id'))
+        return cls(*item)
+
+
+class Period(NamedTuple):
+    """A stint at a club; `end` is None while it is still running."""
+    start: datetime
+    end: Optional[datetime]
+
+
+def transfers_from_json(items: Iterable) -> List[Transfer]:
+    return [Transfer.from_json(item) for item in items]
+
+
+def sort_transfers(transfers: List[Transfer]) -> List[Transfer]:
+    """Sort by date in place (unparseable dates first) and return the list."""
+    transfers.sort(key=Transfer.sort_key)
+    return transfers
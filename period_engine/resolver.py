@@ -0,0 +1,167 @@
+import asyncio
+from typing import Callable, Dict, List, Optional
+
+from period_engine.browser_pool import AsyncPagePool
+from period_engine.cache import TransferCache
+from period_engine.clubs import ClubMatcher
+from period_engine.journal import ResultJournal, journal_key
+from period_engine.periods import format_periods
+from period_engine.player_registry import PlayerRegistry
+from period_engine.records import Transfer
+from period_engine.timeline import CareerIndex
+from period_engine.timing import timer
+from period_engine.transfers import get_transfer_history_async
+
+
+async def fetch_player(player: Dict[str, str], page_pool: AsyncPagePool,
+                       cache: Optional[TransferCache] = None,
+                       fetch_mode: str = 'api') -> Optional[List[Transfer]]:
+    """Fetch one player's transfer history; None when the fetch failed, [] when there are no transfers."""
+    print(f"\nProcessing {player['name']} for club {player['club']}...")
+    with timer.player(player['profile_url']):
+        return await get_transfer_history_async(player['profile_url'], page_pool, cache, fetch_mode)
+
+
+async def fetch_history(player: Dict[str, str], page_pool: AsyncPagePool,
+                        cache: Optional[TransferCache] = None,
+                        fetch_mode: str = 'api',
+                        registry: Optional[PlayerRegistry] = None) -> Optional[List[Transfer]]:
+    """fetch_player(); with a `registry`, through its shared cache and joining a running fetch of the same player."""
+    if registry is not None:
+        return await registry.fetch(player['profile_url'],
+                                    lambda: fetch_player(player, page_pool, registry.cache, fetch_mode))
+    return await fetch_player(player, page_pool, cache, fetch_mode)
+
+
+def build_period_row(player: Dict[str, str], transfers: Optional[List[Transfer]], period_fn: Callable,
+                     no_data: str = "NO DATA",
+                     timeline: Optional[CareerIndex] = None) -> Optional[Dict[str, str]]:
+    """Compute one player's periods at `player['club']`; None when there is no history.
+
+    With a `timeline` the periods come from the player's indexed career.
+    """
+    name = player['name']
+    club = player['club']
+    if transfers is None:
+        print(f"Could not fetch the transfer history of {name}")
+        return None
+    if not transfers:
+        print(f"No transfer history found for {name}")
+        return None
+
+    if timeline is not None:
+        periods_list = timeline.periods(player['profile_url'], club, transfers)
+    else:
+        periods_list = period_fn(transfers, club)
+    if not periods_list:
+        print(f"No periods found for {name} in {club}")
+    return {
+        'name': name,
+        'club': club,
+        'periods': format_periods(periods_list, no_data)
+    }
+
+
+async def resolve_with_pool(players: List[Dict[str, str]], page_pool: AsyncPagePool, period_fn: Callable,
+                            no_data: str = "NO DATA",
+                            cache: Optional[TransferCache] = None,
+                            fetch_mode: str = 'api',
+                            matcher: Optional[ClubMatcher] = None,
+                            timeline: Optional[CareerIndex] = None,
+                            journal: Optional[ResultJournal] = None,
+                            window: Optional[int] = None,
+                            on_row: Optional[Callable] = None,
+                            registry: Optional[PlayerRegistry] = None) -> List[Optional[Dict[str, str]]]:
+    """Resolve every player's periods at their club on a pool the caller owns, so several jobs can share one browser.
+
+    Up to `window` fetches (default 4 x the pool size) are in flight at once,
+    and a new one starts as soon as any finishes, so one slow profile never
+    leaves the other pages idle. A profile listed twice is fetched once.
+    When `matcher` is given, the club strings of each group of finished
+    fetches are resolved in one batch before their periods are computed.
+    Players whose club is already in `timeline` are answered without a
+    fetch. With a `journal`, finished players are recorded one by
+    one and players it already holds are not redone.
+
+    Returns one entry per player (None when unresolved or already streamed).
+    With `on_row`, every player is handed to `on_row(player, row)` in input
+    order as soon as it and the players before it are finished, and the
+    streamed rows are not kept. With a `registry`, histories come from the
+    cross-league player registry's shared cache instead of `cache`.
+    """
+    window = window or page_pool.size * 4
+    rows: List[Optional[Dict[str, str]]] = [None] * len(players)
+    done = [False] * len(players)
+    cursor = 0
+
+    def emit():
+        nonlocal cursor
+        while cursor < len(players) and done[cursor]:
+            on_row(players[cursor], rows[cursor])
+            rows[cursor] = None
+            cursor += 1
+
+    pending = []
+    answered = 0
+    for i, player in enumerate(players):
+        key = journal_key(player['profile_url'], player['club'])
+        if journal is not None and key in journal:
+            rows[i] = journal.get(key)
+            done[i] = True
+            answered += 1
+            continue
+        periods_list = timeline.lookup(player['profile_url'], player['club']) if timeline is not None else None
+        if periods_list is not None:
+            rows[i] = {'name': player['name'], 'club': player['club'],
+                       'periods': format_periods(periods_list, no_data)}
+            done[i] = True
+            answered += 1
+            if journal is not None:
+                journal.record(player['profile_url'], player['club'], rows[i])
+        else:
+            pending.append(i)
+    if answered:
+        print(f"{answered} of {len(players)} players answered from the journal or career index")
+    if on_row is not None:
+        emit()
+
+    by_url: Dict[str, List[int]] = {}
+    for i in pending:
+        by_url.setdefault(players[i]['profile_url'], []).append(i)
+    queued = iter(by_url.values())
+    in_flight: Dict[asyncio.Future, List[int]] = {}
+    try:
+        while True:
+            for indexes in queued:
+                in_flight[asyncio.ensure_future(fetch_history(players[indexes[0]], page_pool, cache, fetch_mode,
+                                                              registry))] = indexes
+                if len(in_flight) >= window:
+                    break
+            if not in_flight:
+                break
+            finished, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            group = [(in_flight.pop(task), task.result()) for task in finished]
+
+            if matcher is not None:
+                clubs = {club for _, transfers in group for transfer in transfers or ()
+                         for club in (transfer.old_club, transfer.new_club)}
+                with timer.phase('match'):
+                    matcher.resolve_batch(clubs, {players[i]['club'] for indexes, _ in group for i in indexes})
+
+            for indexes, transfers in group:
+                for i in indexes:
+                    player = players[i]
+                    with timer.player(player['profile_url']), timer.phase('periods'):
+                        rows[i] = build_period_row(player, transfers, period_fn, no_data, timeline)
+                    timer.finish(player['profile_url'], name=player['name'], club=player['club'],
+                                 transfers=len(transfers or ()))
+                    # Failed fetches are left out so a resumed run tries them again
+                    if journal is not None and rows[i] is not None:
+                        journal.record(player['profile_url'], player['club'], rows[i])
+                    done[i] = True
+            if on_row is not None:
+                emit()
+    finally:
+        for task in in_flight:
+            task.cancel()
+    return rows
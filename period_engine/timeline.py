@@ -0,0 +1,145 @@
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from period_engine.cache import extract_player_id
+from period_engine.clubs import ClubMatcher
+from period_engine.periods import close_open_periods, get_period_spans
+from period_engine.records import Period, Transfer
+
+# Transfer "clubs" that are not clubs and never get a stint of their own
+NON_CLUBS = {'retired', 'without club', 'career break', 'unknown', '?'}
+# Bumped when stints are computed differently, so entries built the old way are rebuilt
+INDEX_VERSION = 2
+
+
+def build_career_timeline(transfers: List[Transfer], matcher: ClubMatcher) -> Dict[str, List[Period]]:
+    """Every club stint in one player's transfers, keyed by canonical club.
+
+    Each stint is computed against the canonical club rather than whichever
+    spelling the transfers list first, so it does not depend on the order
+    of the rows. Stints that are still running end in None, so a stored
+    timeline does not go stale as time passes.
+    """
+    timeline = {}
+    for transfer in transfers:
+        if transfer.new_key in NON_CLUBS:
+            continue
+        canonical = matcher.canonical(transfer.new_club)
+        if canonical not in timeline:
+            timeline[canonical] = get_period_spans(transfers, canonical, matcher)
+    return timeline
+
+
+class CareerIndex:
+    """Career timelines on disk, indexed by player ID and canonical club.
+
+    A player's transfers are turned into every club stint once. Later queries
+    for any club, from this league or another one sharing the file, are
+    lookups that need no fetch. Entries older than `ttl_days` are rebuilt,
+    and so are entries built under other aliases (`aliases_version` is the
+    alias registry's digest), since stints are keyed by canonical club.
+    """
+
+    def __init__(self, matcher: ClubMatcher, path: str = os.path.join('cache', 'career_index.json'),
+                 ttl_days: float = 30, force_refresh: bool = False, aliases_version: str = ''):
+        self.matcher = matcher
+        self.aliases_version = aliases_version
+        self.path = path
+        self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.force_refresh = force_refresh
+        self.entries: Dict[str, Dict] = {}
+        self._other_entries: Dict[str, Dict] = {}
+        self.lookups = 0
+        self.builds = 0
+        self.load()
+
+    def load(self):
+        """Read the index file, keeping only entries that are still fresh."""
+        if self.force_refresh or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring unreadable career index {self.path}: {e}")
+            return
+        now = time.time()
+        for player_id, entry in stored.items():
+            if now - entry.get('built_at', 0) > self.ttl_seconds or entry.get('version', 1) != INDEX_VERSION:
+                continue
+            if entry.get('aliases', '') != self.aliases_version:
+                # Kept as stored, for another league sharing this file
+                self._other_entries[player_id] = entry
+                continue
+            self.entries[player_id] = {
+                'built_at': entry['built_at'],
+                'stints': {
+                    club: [Period(datetime.fromisoformat(start), datetime.fromisoformat(end) if end else None)
+                           for start, end in spans]
+                    for club, spans in entry['stints'].items()
+                }
+            }
+
+    def save(self):
+        """Write the index back to disk."""
+        stored = dict(self._other_entries)
+        stored.update({
+            player_id: {
+                'built_at': entry['built_at'],
+                'version': INDEX_VERSION,
+                'aliases': self.aliases_version,
+                'stints': {
+                    club: [[start.isoformat(), end.isoformat() if end else None] for start, end in spans]
+                    for club, spans in entry['stints'].items()
+                }
+            }
+            for player_id, entry in self.entries.items()
+        })
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        # Write-then-rename so an interrupted run never leaves a truncated index
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+
+    def lookup(self, profile_url: str, club: str) -> Optional[List[Period]]:
+        """Return the indexed periods at `club`, or None when the index cannot answer."""
+        player_id = extract_player_id(profile_url)
+        entry = self.entries.get(player_id) if player_id is not None else None
+        if entry is None:
+            return None
+        spans = entry['stints'].get(self.matcher.canonical(club))
+        if spans is None:
+            return None
+        self.lookups += 1
+        return close_open_periods(spans)
+
+    def periods(self, profile_url: str, club: str,
+                transfers: List[Transfer]) -> List[Period]:
+        """Periods at `club`, indexing the player's whole career from `transfers` on a miss.
+
+        The periods computed for the queried club are stored under its
+        canonical name, replacing the stint built for the whole career, so a
+        later lookup gives the same answer as this call. Clubs that are not
+        among the player's stints (a fuzzy-only match, or no stint at all)
+        are remembered the same way, empty answers included.
+        """
+        periods = self.lookup(profile_url, club)
+        if periods is not None:
+            return periods
+        spans = get_period_spans(transfers, club, self.matcher)
+        player_id = extract_player_id(profile_url)
+        if player_id is not None and transfers:
+            entry = self.entries.get(player_id)
+            if entry is None:
+                entry = {'built_at': time.time(), 'stints': build_career_timeline(transfers, self.matcher)}
+                self.entries[player_id] = entry
+                self.builds += 1
+            entry['stints'][self.matcher.canonical(club)] = spans
+        return close_open_periods(spans)
+
+    def summary(self) -> str:
+        return f"Career index: {len(self.entries)} players, {self.builds} built, {self.lookups} lookups"
@@ -0,0 +1,90 @@
+import json
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+# Player whose work is being timed in the current task
+_current_player: ContextVar[Optional[str]] = ContextVar('period_timing_player', default=None)
+
+
+class PhaseTimer:
+    """Wall-clock time per pipeline phase, per player and in aggregate.
+
+    Phases timed inside player() (keyed by profile URL) are added to that
+    player's record until finish() closes it. The key lives in a context
+    variable, so concurrent asyncio tasks keep separate records. Phases
+    outside any player, such as batch club matching, only count towards the
+    summary. With dump_to() every finished record is also written as one
+    JSON line.
+    """
+
+    def __init__(self):
+        self.durations: Dict[str, List[float]] = {}
+        self._records: Dict[str, Dict[str, float]] = {}
+        self._jsonl = None
+
+    def dump_to(self, path: str):
+        """Write a JSON line per finished player to `path`."""
+        self._jsonl = open(path, 'w', encoding='utf-8')
+
+    @contextmanager
+    def player(self, key: str):
+        """Attribute the phases timed inside this block to player `key`."""
+        token = _current_player.set(key)
+        try:
+            yield
+        finally:
+            _current_player.reset(token)
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started, _current_player.get())
+
+    def add(self, name: str, seconds: float, key: Optional[str] = None):
+        self.durations.setdefault(name, []).append(seconds)
+        if key is not None:
+            record = self._records.setdefault(key, {})
+            record[name] = record.get(name, 0.0) + seconds
+
+    def finish(self, key: str, **fields) -> Dict[str, float]:
+        """Close a player's record and return its phase times."""
+        record = self._records.pop(key, {})
+        if self._jsonl is not None:
+            line = dict(fields, profile_url=key, phases={name: round(seconds, 6) for name, seconds in record.items()})
+            self._jsonl.write(json.dumps(line, ensure_ascii=False) + "\n")
+            self._jsonl.flush()
+        return record
+
+    def summary(self) -> str:
+        if not self.durations:
+            return "[timing] nothing measured"
+        lines = [f"[timing] {'phase':<18} {'count':>6} {'p50':>8} {'p95':>8} {'max':>8} {'total':>9}"]
+        for name, values in sorted(self.durations.items(), key=lambda item: -sum(item[1])):
+            ordered = sorted(values)
+            lines.append(f"[timing] {name:<18} {len(ordered):>6} {percentile(ordered, 0.5):>7.3f}s "
+                         f"{percentile(ordered, 0.95):>7.3f}s {ordered[-1]:>7.3f}s {sum(ordered):>8.2f}s")
+        return "\n".join(lines)
+
+    def close(self):
+        if self._jsonl is not None:
+            self._jsonl.close()
+            self._jsonl = None
+
+
+# Shared by the fetchers, the page pools and the resolver of one run
+timer = PhaseTimer()
@@ -0,0 +1,173 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+from period_engine.browser_pool import AsyncPagePool
+from period_engine.cache import TransferCache, extract_club_id, extract_player_id
+from period_engine.records import Transfer, parse_date, sort_transfers
+from period_engine.timing import timer
+
+TRANSFER_GRID_SELECTOR = 'div.tm-player-transfer-history-grid'
+TRANSFER_API_PATH = '/ceapi/transferHistory/list/'
+
+# 'api' requests the JSON the grid is built from, 'capture' listens for that
+# response while the page loads, 'dom' waits for the rendered grid. The first
+# two fall back to 'dom' when no usable payload arrives.
+FETCH_MODES = ('api', 'capture', 'dom')
+
+
+def convert_to_transfers_url(profile_url: str) -> str:
+    return profile_url.replace('/profil/', '/transfers/')
+
+
+def convert_to_api_url(profile_url: str) -> Optional[str]:
+    """Return the transfer-history JSON endpoint for a /spieler/<id> profile URL."""
+    player_id = extract_player_id(profile_url)
+    if player_id is None:
+        return None
+    parts = urlsplit(profile_url)
+    return f"{parts.scheme}://{parts.netloc}{TRANSFER_API_PATH}{player_id}"
+
+
+def parse_transfer_history(html_content: str) -> List[Transfer]:
+    """Extract the transfer rows from a rendered /transfers/ page."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    transfer_rows = soup.find_all('div', class_='grid tm-player-transfer-history-grid')
+    if not transfer_rows:
+        return []
+    transfers = []
+    for row in transfer_rows:
+        if 'tm-player-transfer-history-grid--sum' in row.get('class', []) or 'tm-player-transfer-history-grid--heading' in row.get('class', []):
+            continue
+        season = row.find('div', class_='tm-player-transfer-history-grid__season')
+        date = row.find('div', class_='tm-player-transfer-history-grid__date')
+        old_club = row.find('div', class_='tm-player-transfer-history-grid__old-club')
+        new_club = row.find('div', class_='tm-player-transfer-history-grid__new-club')
+        if season and date and old_club and new_club:
+            season_text = season.text.strip()
+            date_text = date.text.strip()
+            old_club_link = old_club.find('a', class_='tm-player-transfer-history-grid__club-link')
+            old_club_text = old_club_link.text.strip() if old_club_link else old_club.text.strip()
+            new_club_link = new_club.find('a', class_='tm-player-transfer-history-grid__club-link')
+            new_club_text = new_club_link.text.strip() if new_club_link else new_club.text.strip()
+            transfers.append(Transfer(season_text, date_text, old_club_text, new_club_text,
+                                      extract_club_id(old_club_link.get('href')) if old_club_link else None,
+                                      extract_club_id(new_club_link.get('href')) if new_club_link else None))
+    return sort_transfers(transfers)
+
+
+def parse_transfer_payload(payload) -> Optional[List[Transfer]]:
+    """Extract the transfer rows from the transfer-history JSON payload.
+
+    Returns None when the payload does not look like a transfer history, so
+    the caller can fall back to the rendered grid.
+    """
+    if not isinstance(payload, dict) or not isinstance(payload.get('transfers'), list):
+        return None
+    transfers = []
+    for item in payload['transfers']:
+        old_side = item.get('from') or {}
+        new_side = item.get('to') or {}
+        old_club = old_side.get('clubName')
+        new_club = new_side.get('clubName')
+        date_text = (item.get('date') or '').strip()
+        if parse_date(date_text) is None and item.get('dateUnformatted'):
+            try:
+                date_text = datetime.strptime(item['dateUnformatted'], '%Y-%m-%d').strftime('%b %d, %Y')
+            except ValueError:
+                pass
+        if old_club is None or new_club is None or not date_text:
+            continue
+        transfers.append(Transfer((item.get('season') or '').strip(), date_text, old_club.strip(), new_club.strip(),
+                                  extract_club_id(old_side.get('href')), extract_club_id(new_side.get('href'))))
+    return sort_transfers(transfers)
+
+
+async def _fetch_api_async(page, profile_url: str) -> Optional[List[Transfer]]:
+    api_url = convert_to_api_url(profile_url)
+    if api_url is None:
+        return None
+    try:
+        with timer.phase('request'):
+            response = await page.request.get(api_url, timeout=15000)
+            payload = await response.json() if response.ok else None
+        if not response.ok:
+            print(f"Transfer API returned {response.status} for {api_url}, falling back to the page")
+            return None
+        with timer.phase('parse'):
+            return parse_transfer_payload(payload)
+    except Exception as e:
+        print(f"Transfer API failed for {api_url}: {e}, falling back to the page")
+        return None
+
+
+async def _fetch_capture_async(page, transfers_url: str) -> Tuple[Optional[List[Transfer]], bool]:
+    navigated = False
+    try:
+        async with page.expect_response(lambda response: TRANSFER_API_PATH in response.url, timeout=15000) as response_info:
+            with timer.phase('goto'):
+                await page.goto(transfers_url, wait_until='domcontentloaded')
+            navigated = True
+        with timer.phase('capture'):
+            response = await response_info.value
+            payload = await response.json()
+        with timer.phase('parse'):
+            return parse_transfer_payload(payload), navigated
+    except Exception as e:
+        print(f"No transfer payload captured for {transfers_url}: {e}, falling back to the grid")
+        return None, navigated
+
+
+async def _fetch_dom_async(page, transfers_url: str, navigated: bool = False) -> str:
+    if not navigated:
+        with timer.phase('goto'):
+            await page.goto(transfers_url)
+    with timer.phase('wait_for_selector'):
+        await page.wait_for_selector(TRANSFER_GRID_SELECTOR, timeout=15000)
+    with timer.phase('content'):
+        return await page.content()
+
+
+async def get_transfer_history_async(profile_url: str, page_pool: AsyncPagePool,
+                                     cache: Optional[TransferCache] = None,
+                                     fetch_mode: str = 'api') -> Optional[List[Transfer]]:
+    """Fetch and parse a player's transfer history on a page borrowed from `page_pool`.
+
+    Returns None when the fetch failed, and an empty list for a player whose
+    history really has no transfers; only the latter is cached.
+    """
+    if cache is not None:
+        with timer.phase('cache'):
+            cached = cache.get(profile_url)
+        if cached is not None:
+            return cached
+
+    transfers_url = convert_to_transfers_url(profile_url)
+    print(f"Fetching URL with Playwright: {transfers_url}")
+    try:
+        async with page_pool.page() as page:
+            if page_pool.profile is not None:
+                page_pool.profile.begin(page, transfers_url)
+            try:
+                transfers = None
+                navigated = False
+                if fetch_mode == 'api':
+                    transfers = await _fetch_api_async(page, profile_url)
+                elif fetch_mode == 'capture':
+                    transfers, navigated = await _fetch_capture_async(page, transfers_url)
+                if transfers is None:
+                    html_content = await _fetch_dom_async(page, transfers_url, navigated)
+            finally:
+                if page_pool.profile is not None:
+                    page_pool.profile.end(page)
+    except Exception as e:
+        print(f"Error fetching {transfers_url}: {e}")
+        return None
+    if transfers is None:
+        with timer.phase('parse'):
+            transfers = parse_transfer_history(html_content)
+    if cache is not None:
+        cache.put(profile_url, transfers)
+    return transfers
@@ -0,0 +1,96 @@
+import random
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# 'first' is the old one-player spot check, 'random' draws uniformly, and
+# 'stratified' takes one player from each equal band of the leaderboard so
+# the top and the tail are both covered.
+SAMPLE_STRATEGIES = ('first', 'random', 'stratified')
+
+# Period values that all mean "no period known"
+EMPTY_PERIODS = {'', 'nan', 'n/a', 'no data'}
+
+
+def normalize_periods(value) -> Tuple[str, ...]:
+    """Turn a period cell ("2005-2010, 2012-2013", "", NaN, "NO DATA") into comparable form."""
+    if value is None or value != value:
+        return ()
+    text = str(value).strip()
+    if text.lower() in EMPTY_PERIODS:
+        return ()
+    return tuple(part.strip() for part in text.split(',') if part.strip())
+
+
+def sample_rows(df: pd.DataFrame, size: int, strategy: str = 'first',
+                rng: Optional[random.Random] = None) -> pd.DataFrame:
+    """Pick up to `size` rows of one club's leaderboard with the given strategy."""
+    if strategy not in SAMPLE_STRATEGIES:
+        raise ValueError(f"Unknown sample strategy {strategy!r}, expected one of {SAMPLE_STRATEGIES}")
+    size = min(size, len(df))
+    if size <= 0:
+        return df.iloc[0:0]
+    if strategy == 'first':
+        return df.head(size)
+    rng = rng or random.Random()
+    if strategy == 'random':
+        positions = sorted(rng.sample(range(len(df)), size))
+    else:
+        bounds = [round(i * len(df) / size) for i in range(size + 1)]
+        positions = [rng.randrange(bounds[i], bounds[i + 1]) for i in range(size)]
+    return df.iloc[positions]
+
+
+class DriftReport:
+    """Per-club comparison of freshly resolved periods against the stored ones."""
+
+    def __init__(self, threshold: float = 0.1):
+        self.threshold = threshold
+        self.checked: Dict[str, int] = {}
+        self.unresolved: Dict[str, int] = {}
+        self.mismatches: Dict[str, List[Tuple[str, str, str]]] = {}
+
+    def add(self, club: str, name: str, expected, actual) -> bool:
+        """Record one re-resolved player; returns True when the periods agree."""
+        self.checked[club] = self.checked.get(club, 0) + 1
+        self.mismatches.setdefault(club, [])
+        if normalize_periods(expected) == normalize_periods(actual):
+            return True
+        self.mismatches[club].append((str(name), ", ".join(normalize_periods(expected)) or "-",
+                                      ", ".join(normalize_periods(actual)) or "-"))
+        return False
+
+    def add_unresolved(self, club: str):
+        """Record a sampled player whose transfer history could not be fetched."""
+        self.unresolved[club] = self.unresolved.get(club, 0) + 1
+
+    def mismatch_rate(self, club: str) -> float:
+        checked = self.checked.get(club, 0)
+        return len(self.mismatches.get(club, [])) / checked if checked else 0.0
+
+    def clubs_to_refetch(self) -> List[str]:
+        return [club for club in self.checked if self.mismatch_rate(club) > self.threshold]
+
+    def lines(self) -> List[str]:
+        lines = [f"{'club':<35} {'checked':>7} {'drift':>5} {'rate':>6} {'failed':>6}"]
+        clubs = sorted(set(self.checked) | set(self.unresolved), key=lambda club: -self.mismatch_rate(club))
+        for club in clubs:
+            flag = "  REFETCH" if self.mismatch_rate(club) > self.threshold else ""
+            lines.append(f"{club:<35} {self.checked.get(club, 0):>7} {len(self.mismatches.get(club, [])):>5} "
+                         f"{self.mismatch_rate(club):>6.0%} {self.unresolved.get(club, 0):>6}{flag}")
+        lines.append("")
+        for club in clubs:
+            for name, expected, actual in self.mismatches.get(club, []):
+                lines.append(f"{club} | {name} | stored: {expected} | now: {actual}")
+        return lines
+
+    def summary(self) -> str:
+        checked = sum(self.checked.values())
+        drifted = sum(len(rows) for rows in self.mismatches.values())
+        rate = drifted / checked if checked else 0.0
+        return (f"Drift: {drifted} of {checked} sampled players differ ({rate:.0%}), "
+                f"{len(self.clubs_to_refetch())} of {len(self.checked)} clubs above {self.threshold:.0%}")
+
+    def write(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("\n".join(self.lines() + ["", self.summary()]) + "\n")
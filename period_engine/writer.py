@@ -0,0 +1,113 @@
+import csv
+import os
+from typing import Dict, Iterable, List, Optional
+
+from period_engine.clubs import normalize_club_name
+
+# profile_url lets the merge step join on player ID instead of the display name
+PERIOD_COLUMNS = ['name', 'club', 'periods', 'profile_url']
+RESULT_SEPARATOR = "-" * 50
+
+
+def club_filename(club: str) -> str:
+    return normalize_club_name(club).replace(" ", "_") + ".csv"
+
+
+def _cell(value) -> str:
+    # Missing values are written as empty cells, like DataFrame.to_csv
+    if value is None or value != value:
+        return ''
+    return str(value)
+
+
+class PeriodCsvWriter:
+    """Writes period rows to one CSV per club as soon as they are resolved.
+
+    Rows go to `<club>.csv.part`; once the last expected player of a club has
+    been seen, the file is renamed to `<club>.csv`, so later steps globbing
+    `period/*.csv` only ever see finished clubs. Clubs without a single row
+    get no file.
+    """
+
+    def __init__(self, output_folder: str, players: Iterable[Dict[str, str]]):
+        self.output_folder = output_folder
+        os.makedirs(output_folder, exist_ok=True)
+        self.expected: Dict[str, int] = {}
+        for player in players:
+            filename = club_filename(player['club'])
+            self.expected[filename] = self.expected.get(filename, 0) + 1
+        self.seen: Dict[str, int] = {}
+        self.written: Dict[str, int] = {}
+        self._files = {}
+        self.finished: List[str] = []
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.output_folder, filename)
+
+    def write(self, player: Dict[str, str], row: Optional[Dict[str, str]]):
+        """Record one player's outcome; `row` is None when the player has no result."""
+        filename = club_filename(player['club'])
+        if row is not None:
+            if filename not in self._files:
+                f = open(self._path(filename) + '.part', 'w', encoding='utf-8', newline='')
+                writer = csv.writer(f, lineterminator=os.linesep)
+                writer.writerow(PERIOD_COLUMNS)
+                self._files[filename] = (f, writer)
+            f, writer = self._files[filename]
+            values = dict(row, profile_url=player['profile_url'])
+            writer.writerow([_cell(values[column]) for column in PERIOD_COLUMNS])
+            f.flush()
+            self.written[filename] = self.written.get(filename, 0) + 1
+        self.seen[filename] = self.seen.get(filename, 0) + 1
+        if self.seen[filename] >= self.expected.get(filename, 0):
+            self._finish(filename)
+
+    def _finish(self, filename: str):
+        entry = self._files.pop(filename, None)
+        if entry is None:
+            return
+        entry[0].close()
+        os.replace(self._path(filename) + '.part', self._path(filename))
+        self.finished.append(filename)
+        print(f"Saved {self.written[filename]} records to {self._path(filename)}")
+
+    def close(self):
+        """Finish every club that is still open (e.g. duplicate player rows)."""
+        for filename in list(self._files):
+            self._finish(filename)
+
+
+class PeriodTextWriter:
+    """Appends _check_period results to all_results.txt as they are resolved."""
+
+    def __init__(self, path: str, no_data: str = "NO DATA"):
+        self.path = path
+        self.no_data = no_data
+        self.count = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, row: Dict[str, str]):
+        self._file.write(self.format_block(row))
+        self._file.flush()
+        self.count += 1
+
+    @staticmethod
+    def format_block(row: Dict[str, str]) -> str:
+        return (f"Name: {row['name']}\n"
+                f"Club: {row['club']}\n"
+                f"Periods: {row['periods']}\n"
+                f"{RESULT_SEPARATOR}\n")
+
+    def close(self, no_data_first: bool = True):
+        """Close the file, then move the `no_data` entries to the top as before."""
+        self._file.close()
+        if not no_data_first:
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            blocks = [block + RESULT_SEPARATOR + "\n" for block in f.read().split(RESULT_SEPARATOR + "\n") if block]
+        blocks.sort(key=lambda block: f"\nPeriods: {self.no_data}\n" not in "\n" + block)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(blocks)
+        os.replace(tmp_path, self.path)
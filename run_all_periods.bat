@@ -0,0 +1,5 @@
+@echo off
+cd /d "F:\PlayWright"
+call venv\Scripts\activate.bat
+python _run_all_periods.py
+pause